@@ -1,5 +1,8 @@
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives import hashes
 from datetime import datetime
 from tkinter import messagebox
@@ -10,6 +13,7 @@ import hashlib
 import struct
 import time
 import logging
+import functools
 import secrets
 import base64
 
@@ -17,15 +21,31 @@ import base64
 logging.basicConfig(filename='steganography.log', level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Metadata record: marker, space-padded author, space-padded unix timestamp
+METADATA_STRUCT = struct.Struct('>4s50s20s')
+
+@functools.lru_cache(maxsize=8)
+def _derive_key(key_str):
+    """Derive a 32-byte key from a password, cached since PBKDF2 is slow on purpose."""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"YrLgT7hpEq2bYw!!7WC9tW8ogVVLhowXv9-iko4MghAuXixm34d6TdtYRA*9ZWiLi7aLWLNw77uEMAoCPZZVd3Y*RT7no_7@pYHm",  # Use a constant salt for reproducibility
+        iterations=100000,
+    )
+    return kdf.derive(key_str.encode('utf-8'))
+
 class GIFSteganographyLogic:
     """Handles the core steganography operations for GIFs (embedding, extracting, etc.)."""
     def __init__(self):
         self.key = None
         self.cipher = None
+        self.aead = None
         self.hmac_key = None
         self.MAX_FILES_EMBED = 20  # Maximum files that can be embedded
         self.MAGIC_MARKER = b'\xDE\xAD\xBE\xEF'
         self.METADATA_MARKER = b'\xCA\xFE\xBA\xBE'
+        self.PAYLOAD_GCM_VERSION = b'\x01'  # Fernet tokens always start with b'g', so this can't collide
 
     def generate_key(self):
         """Generate a random encryption key as a string."""
@@ -62,15 +82,11 @@ class GIFSteganographyLogic:
                 key = base64.urlsafe_b64encode(key_bytes)
             else:
                 # Derive a Fernet key from the password
-                kdf = PBKDF2HMAC(
-                    algorithm=hashes.SHA256(),
-                    length=32,
-                    salt=b"YrLgT7hpEq2bYw!!7WC9tW8ogVVLhowXv9-iko4MghAuXixm34d6TdtYRA*9ZWiLi7aLWLNw77uEMAoCPZZVd3Y*RT7no_7@pYHm",  # Use a constant salt for reproducibility
-                    iterations=100000,
-                )
-                key_bytes = kdf.derive(key_str.encode('utf-8'))
+                key_bytes = _derive_key(key_str)
                 key = base64.urlsafe_b64encode(key_bytes)
             self.cipher = Fernet(key)
+            # File payloads use AES-GCM under a separate subkey so no key is shared between the two ciphers
+            self.aead = AESGCM(HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b'HideNSeek payload').derive(key_bytes))
             # HMAC key can be derived from key_bytes or key_str as before
             self.hmac_key = hashlib.sha256(key_bytes).digest()
             self.key = key_bytes
@@ -81,6 +97,23 @@ class GIFSteganographyLogic:
                 root.after(0, lambda: messagebox.showerror("Error", "Invalid key or password:" + str(e)))
             return False
 
+    def encrypt_payload(self, data):
+        """Encrypt a file payload with AES-GCM into a version-tagged token."""
+        nonce = os.urandom(12)
+        # Base64 keeps the token free of 0x3B bytes, like a Fernet token, so the trailer search stays valid
+        return self.PAYLOAD_GCM_VERSION + base64.urlsafe_b64encode(nonce + self.aead.encrypt(nonce, data, None))
+
+    def decrypt_payload(self, token):
+        """Decrypt a file payload, accepting AES-GCM tokens and Fernet tokens from older GIFs."""
+        if token[:1] == self.PAYLOAD_GCM_VERSION:
+            try:
+                raw = base64.urlsafe_b64decode(token[1:])
+                return self.aead.decrypt(raw[:12], raw[12:], None)
+            except ValueError as e:
+                # Bad base64 or a truncated nonce is as much a failed decryption as a bad tag
+                raise InvalidTag() from e
+        return self.cipher.decrypt(token)
+
     def derive_password_hash(self, password):
         """Derive a hash from the password for authentication."""
         kdf = PBKDF2HMAC(
@@ -173,7 +206,7 @@ class GIFSteganographyLogic:
                 filename = f"{base_name}_{i+1}".encode('utf-8', errors='replace')[:50].ljust(50, b' ')
                 ext = os.path.splitext(path)[1].encode('utf-8', errors='replace')[:10].ljust(10, b' ')
                 compressed_data = self.compress_data(raw_data)
-                encrypted_data = self.cipher.encrypt(compressed_data)
+                encrypted_data = self.encrypt_payload(compressed_data)
                 file_metadata.append((filename, ext, len(encrypted_data)))
                 all_encrypted_data.extend(encrypted_data)
                 progress_callback(10 + (80 * (i + 1) // file_count))
@@ -181,7 +214,7 @@ class GIFSteganographyLogic:
 
         author_bytes = author.strip().encode('utf-8', errors='replace')[:50].ljust(50, b' ')
         timestamp = str(int(time.time())).encode('utf-8')[:20].ljust(20, b' ')
-        metadata = self.METADATA_MARKER + author_bytes + timestamp
+        metadata = METADATA_STRUCT.pack(self.METADATA_MARKER, author_bytes, timestamp)
         encrypted_metadata = self.cipher.encrypt(metadata)
 
         file_metadata_bytes = b"".join(fn + ext + struct.pack(">I", dl) for fn, ext, dl in file_metadata)
@@ -274,8 +307,9 @@ class GIFSteganographyLogic:
                     raise ValueError(f"Data for file {filename} incomplete.")
                 encrypted_data = hidden_data[start_index:start_index + length]
                 start_index += length
+                decrypted_data = decompressed_data = None  # Bound up front so the finally cleanup can't mask the real error
                 try:
-                    decrypted_data = self.cipher.decrypt(encrypted_data)
+                    decrypted_data = self.decrypt_payload(encrypted_data)
                     decompressed_data = self.decompress_data(decrypted_data)
                     
                     new_filename = f"{filename}_{current_date}"
@@ -3,12 +3,16 @@ from PIL import Image
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes, hmac
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.exceptions import InvalidTag
 import os
 import struct
 import hashlib
 import zlib
 import base64
 import logging
+import functools
 import time
 import secrets
 import numpy as np
@@ -17,14 +21,34 @@ import numpy as np
 logging.basicConfig(filename='steganography.log', level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Metadata record: marker, space-padded author, space-padded unix timestamp
+METADATA_STRUCT = struct.Struct('>4s50s20s')
+
+@functools.lru_cache(maxsize=8)
+def _derive_key(key_str):
+    """Derive a 32-byte key from a password, cached since PBKDF2 is slow on purpose."""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"P673XfybNqgEm9PPBDtoP4CFqroTHRjG.vE94hDftUGXK.AkjHqp-yqmh2DAi3@4D-ewUu@xp_GC7eqegGVXz4MYECgH-8vCumU*",  # Use a constant salt for reproducibility
+        iterations=100000,
+    )
+    return kdf.derive(key_str.encode('utf-8'))
+
+def _png_chunk(tag, data):
+    """Frame one PNG chunk: length, tag, payload and the CRC over tag and payload."""
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF)
+
 class SteganographyLogic:
     """Handles steganography logic for embedding and extracting data in images."""
     def __init__(self):
         self.cipher = None
+        self.aead = None
         self.MAX_FILES_EMBED = 20
         self.MAX_REASONABLE_SIZE = 1024 * 1024 * 100  # 100 MB max
         self.MAGIC_MARKER = b'\xDE\xAD\xBE\xEF'
         self.METADATA_MARKER = b'\xCA\xFE\xBA\xBE'
+        self.PAYLOAD_GCM_VERSION = b'\x01'  # Fernet tokens always start with b'g', so this can't collide
 
     def generate_key(self):
         """Generate a random encryption key as a string."""
@@ -53,15 +77,11 @@ class SteganographyLogic:
                 key = base64.urlsafe_b64encode(key_bytes)
             else:
                 # Derive a Fernet key from the password
-                kdf = PBKDF2HMAC(
-                    algorithm=hashes.SHA256(),
-                    length=32,
-                    salt=b"P673XfybNqgEm9PPBDtoP4CFqroTHRjG.vE94hDftUGXK.AkjHqp-yqmh2DAi3@4D-ewUu@xp_GC7eqegGVXz4MYECgH-8vCumU*",  # Use a constant salt for reproducibility
-                    iterations=100000,
-                )
-                key_bytes = kdf.derive(key_str.encode('utf-8'))
+                key_bytes = _derive_key(key_str)
                 key = base64.urlsafe_b64encode(key_bytes)
             self.cipher = Fernet(key)
+            # File payloads use AES-GCM under a separate subkey so no key is shared between the two ciphers
+            self.aead = AESGCM(HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b'HideNSeek payload').derive(key_bytes))
             self.key = key_bytes
             return True
         except Exception as e:
@@ -81,6 +101,23 @@ class SteganographyLogic:
         except zlib.error as e:
             raise ValueError("Decompression failed")
 
+    def encrypt_payload(self, data):
+        """Encrypt a file payload with AES-GCM into a version-tagged token."""
+        nonce = os.urandom(12)
+        # Base64 keeps the token ASCII like a Fernet token, so it can never form the 0xFFFE terminator
+        return self.PAYLOAD_GCM_VERSION + base64.urlsafe_b64encode(nonce + self.aead.encrypt(nonce, data, None))
+
+    def decrypt_payload(self, token):
+        """Decrypt a file payload, accepting AES-GCM tokens and Fernet tokens from older images."""
+        if token[:1] == self.PAYLOAD_GCM_VERSION:
+            try:
+                raw = base64.urlsafe_b64decode(token[1:])
+                return self.aead.decrypt(raw[:12], raw[12:], None)
+            except ValueError as e:
+                # Bad base64 or a truncated nonce is as much a failed decryption as a bad tag
+                raise InvalidTag() from e
+        return self.cipher.decrypt(token)
+
     def derive_password_hash(self, password):
         """Derive a 32-byte hash from the password using PBKDF2HMAC."""
         if not password:
@@ -151,7 +188,7 @@ class SteganographyLogic:
                     filename = f"{base_name}_{i+1}".encode('utf-8', errors='replace')[:50].ljust(50, b' ')
                     ext = os.path.splitext(path)[1].encode('utf-8', errors='replace')[:10].ljust(10, b' ')
                     compressed_data = self.compress_data(raw_data)
-                    encrypted_data = self.cipher.encrypt(compressed_data)
+                    encrypted_data = self.encrypt_payload(compressed_data)
                     file_metadata.append((filename, ext, len(encrypted_data)))
                     all_encrypted_data.extend(encrypted_data)
                     update_progress_callback(10 + (80 * (i + 1) // file_count))
@@ -159,7 +196,7 @@ class SteganographyLogic:
 
             author_bytes = (author or "N/A").encode('utf-8', errors='replace')[:50].ljust(50, b' ')
             timestamp = str(int(time.time())).encode('utf-8')[:20].ljust(20, b' ')
-            metadata = self.METADATA_MARKER + author_bytes + timestamp
+            metadata = METADATA_STRUCT.pack(self.METADATA_MARKER, author_bytes, timestamp)
             encrypted_metadata = self.cipher.encrypt(metadata)
 
             file_metadata_bytes = b"".join(fn + ext + struct.pack(">I", dl) for fn, ext, dl in file_metadata)
@@ -172,17 +209,16 @@ class SteganographyLogic:
 
             length_prefix = struct.pack(">I", len(hidden_data))
             full_data = length_prefix + hidden_data
-            data_bits = ''.join([f'{byte:08b}' for byte in full_data]) + '1111111111111110'
+            # Payload bits followed by the 1111111111111110 termination sequence (0xFFFE)
+            data_bits = np.unpackbits(np.frombuffer(full_data + b'\xff\xfe', dtype=np.uint8))
 
             flat_image = image_array.flatten()
             if len(data_bits) > len(flat_image):
                 raise ValueError(f"Data too large for carrier image. Required: {len(data_bits)} bits, Available: {len(flat_image)} bits")
 
-
-            for i in range(len(data_bits)):
-                pixel_value = flat_image[i] & 0xFE  # 0xFE is 11111110 in binary, clears the LSB
-                bit_value = int(data_bits[i])
-                flat_image[i] = pixel_value | bit_value
+            # 0xFE is 11111110 in binary, clears the LSB before the payload bit is set
+            bit_count = len(data_bits)
+            flat_image[:bit_count] = (flat_image[:bit_count] & 0xFE) | data_bits
 
             modified_image = flat_image.reshape(image_array.shape)
             update_progress_callback(90)
@@ -192,6 +228,49 @@ class SteganographyLogic:
             raise
         
 
+    def save_png(self, image, save_path):
+        """Write the stego image as a PNG with unfiltered rows and fast zlib compression."""
+        if image.mode not in ('RGB', 'RGBA'):
+            image.save(save_path, format="PNG", compress_level=1, optimize=False)
+            return
+        width, height = image.size
+        row_bytes = width * len(image.mode)
+        color_type = 6 if image.mode == 'RGBA' else 2
+        compressor = zlib.compressobj(1)
+        rows_per_block = max(1, (4 << 20) // (row_bytes + 1))
+        with open(save_path, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n')
+            f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)))
+            # Copy out and compress ~4 MB of rows at a time, so extra memory stays at one block, not the image
+            for start in range(0, height, rows_per_block):
+                end = min(start + rows_per_block, height)
+                rows = image.crop((0, start, width, end)).tobytes()
+                # Every scanline gets a leading filter-type byte of 0 (None), skipping Pillow's per-row filter search
+                scanlines = np.zeros((end - start, row_bytes + 1), dtype=np.uint8)
+                scanlines[:, 1:] = np.frombuffer(rows, dtype=np.uint8).reshape(end - start, row_bytes)
+                block = compressor.compress(scanlines)
+                if block:
+                    f.write(_png_chunk(b'IDAT', block))
+            f.write(_png_chunk(b'IDAT', compressor.flush()))
+            f.write(_png_chunk(b'IEND', b''))
+
+    def read_lsb_payload(self, flat_image, block=1 << 20):
+        """Return the bytes stored in the LSBs before the termination sequence, or None if there is none."""
+        # The 1111111111111110 sequence ends on a 0 bit preceded by at least 15 ones, i.e. on a
+        # zero whose previous zero is 16 or more bits back (a virtual zero sits at index -1).
+        # Scan block by block so a small payload stops early, carrying the last zero across blocks
+        last_zero = -1
+        for start in range(0, flat_image.size, block):
+            zeros = np.flatnonzero((flat_image[start:start + block] & 1) == 0) + start
+            if zeros.size == 0:
+                continue
+            hits = np.flatnonzero(np.diff(zeros, prepend=last_zero) >= 16)
+            if hits.size:
+                data_bit_count = int(zeros[hits[0]]) + 1 - 16
+                return np.packbits(flat_image[:data_bit_count - data_bit_count % 8] & 1).tobytes()
+            last_zero = int(zeros[-1])
+        return None
+
     def extract_data(self, image_path, key_str, password, update_progress_callback, carrier_filename=None, key_is_generated=False):
         """Extract multiple files and metadata from an image with custom filename format."""
         if not self.get_cipher(key_str, None, key_is_generated):
@@ -203,30 +282,17 @@ class SteganographyLogic:
         current_date = datetime.now().strftime('%Y-%m-%d')
 
         try:
-            carrier_image = Image.open(image_path).convert('RGB')
-            image_array = np.array(carrier_image, dtype=np.uint8)
-            flat_image = image_array.flatten()
+            # Extraction only reads the pixels, so view the single tobytes() copy instead of copying it twice
+            with Image.open(image_path) as carrier_image:
+                if carrier_image.mode != 'RGB':
+                    carrier_image = carrier_image.convert('RGB')
+                flat_image = np.frombuffer(carrier_image.tobytes(), dtype=np.uint8)
 
-            bits = []
-            i = 0
             update_progress_callback(10)
-            while i < len(flat_image):
-                bit = flat_image[i] & 1
-                bits.append(str(bit))
-                i += 1
-                if i >= 16 and ''.join(bits[-16:]) == '1111111111111110':
-                    break
-
-            if i >= len(flat_image):
+            full_data = self.read_lsb_payload(flat_image)
+            if full_data is None:
                 raise ValueError("Termination sequence not found in image")
 
-            data_bits = bits[:-16]
-            byte_array = bytearray()
-            for j in range(0, len(data_bits), 8):
-                byte = ''.join(data_bits[j:j+8])
-                byte_array.append(int(byte, 2))
-            full_data = bytes(byte_array)
-
             update_progress_callback(30)
 
             if len(full_data) < 4:
@@ -295,13 +361,13 @@ class SteganographyLogic:
                 encrypted_data = all_encrypted_data[pos:pos+data_length]
                 pos += data_length
                 try:
-                    compressed_data = self.cipher.decrypt(encrypted_data)
+                    compressed_data = self.decrypt_payload(encrypted_data)
                     raw_data = self.decompress_data(compressed_data)
                     # Use the filename stored in metadata, which includes the original carrier name
                     new_filename = f"{filename_str}_{current_date}"
                     files_data.append((new_filename, ext_str, raw_data))
                     update_progress_callback(60 + (30 * (i + 1) // file_count))
-                except InvalidToken:
+                except (InvalidToken, InvalidTag):
                     raise ValueError(f"Decryption failed for file {filename_str}")
                 except zlib.error as e:
                     raise ValueError(f"Decompression failed for file {filename_str}")
@@ -5,11 +5,14 @@ import customtkinter as ctk
 import numpy as np
 import os
 import threading
+import queue
+import concurrent.futures
 import hashlib
-import pyperclip
 import json
+import bisect
+import re
 import gc
-import struct
+import time
 from tkinterdnd2 import TkinterDnD, DND_FILES
 import sys
 import logging
@@ -17,6 +20,8 @@ from img import SteganographyLogic
 from gif import GIFSteganographyLogic
 import tempfile
 import shutil
+import atexit
+from collections import OrderedDict
 
 if getattr(sys, 'frozen', False):
     base_path = sys._MEIPASS
@@ -26,26 +31,141 @@ if getattr(sys, 'frozen', False):
 button_width = 120
 button_pady = 10
 button_size = 12
-main_font = ("Helvetica", 20, "bold")
+
+try:
+    import xxhash  # Optional: SIMD xxh3 is much faster than any hashlib digest for the tamper check
+    _carrier_hasher = xxhash.xxh3_128  # 128-bit, matching the 16-byte BLAKE2b fallback
+except ImportError:
+    if sys.version_info >= (3, 9):
+        # Not a security use, so FIPS-restricted OpenSSL builds still allow the digest (keyword is 3.9+)
+        _carrier_hasher = lambda: hashlib.blake2b(digest_size=16, usedforsecurity=False)
+    else:
+        _carrier_hasher = lambda: hashlib.blake2b(digest_size=16)
+
+try:
+    import orjson  # Optional: C-accelerated JSON for the history file
+    _history_line = lambda entry: orjson.dumps(entry) + b'\n'
+    _history_loads = orjson.loads
+except ImportError:
+    _history_line = lambda entry: (json.dumps(entry, separators=(',', ':')) + '\n').encode('utf-8')
+    _history_loads = json.loads
+
+def _file_hash(path):
+    """Fingerprint a carrier file so later operations can detect changes on disk."""
+    # Only a tamper tripwire, not a security boundary, so a fast non-cryptographic hash is preferred
+    with open(path, "rb") as f:
+        # Stream the file through the hash in fixed-size chunks instead of reading it whole
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, _carrier_hasher).hexdigest()
+        h = _carrier_hasher()
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _count_lsb_ones(flat, block=1 << 20):
+    """Count pixel bytes with their LSB set, one block at a time through a reused scratch buffer."""
+    scratch = np.empty(min(block, flat.size), dtype=np.uint8)
+    ones = 0
+    for start in range(0, flat.size, block):
+        chunk = flat[start:start + block]
+        out = scratch[:chunk.size]
+        np.bitwise_and(chunk, 1, out=out)
+        ones += np.count_nonzero(out)
+    return ones
+
+def _write_file(path, data):
+    """Write one extracted file to disk."""
+    # Unbuffered writes hand the payload straight to the kernel, skipping the stdio buffer copy
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 class HistoryManager:
     """Manages the history of embedding and extraction operations."""
+    FLUSH_DELAY = 5.0  # Seconds to batch new entries before writing them out
+    _ENTRY_KEYS = {"timestamp", "operation", "details"}
+
     def __init__(self):
-        self.history_file = "history.json"
-        self.history = self.load_history()
+        self.history_file = "history.jsonl"  # One JSON entry per line, append-only
+        self.legacy_history_file = "history.json"
+        # Columns of the in-memory history (struct-of-arrays); row i is (timestamps[i], operations[i], details[i])
+        self.timestamps, self.operations, self.details = [], [], []
+        self._append_columns(self.load_history())
+        self._pending = []
+        self._flush_timer = None
+        self._lock = threading.Lock()
+        # Make sure pending entries reach the disk on shutdown
+        atexit.register(self.flush)
 
     def load_history(self):
-        """Load history from file."""
+        """Load history from file, migrating the old single-list JSON file if needed."""
         try:
-            with open(self.history_file, 'r') as f:
-                return json.load(f)
+            with open(self.history_file, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = None
+        if data is not None:
+            complete, _, tail = data.rpartition(b'\n')
+            entries = [entry for entry in map(self._decode_line, complete.split(b'\n')) if entry is not None]
+            if tail.strip():
+                # A crash mid-flush can leave the last line unterminated; finish or cut it so later appends start cleanly
+                entry = self._decode_line(tail)
+                if entry is None:
+                    os.truncate(self.history_file, len(data) - len(tail))
+                else:
+                    with open(self.history_file, 'ab') as f:
+                        f.write(b'\n')
+                    entries.append(entry)
+            return entries
+        try:
+            with open(self.legacy_history_file, 'r') as f:
+                history = json.load(f)
         except FileNotFoundError:
             return []
+        self.save_history(history)
+        return history
+
+    def _decode_line(self, line):
+        """Decode one history line, returning None for blank or damaged lines."""
+        if not line.strip():
+            return None
+        try:
+            entry = _history_loads(line)
+        except ValueError as e:
+            logging.error(f"Skipping unreadable history line: {str(e)}")
+            return None
+        # Valid JSON that isn't a full entry object would break the column lists just the same
+        if not isinstance(entry, dict) or not self._ENTRY_KEYS <= entry.keys():
+            logging.error("Skipping malformed history entry")
+            return None
+        return entry
+
+    def save_history(self, entries):
+        """Append entries to the history file."""
+        with open(self.history_file, 'ab') as f:
+            f.writelines(_history_line(entry) for entry in entries)
+
+    def flush(self):
+        """Write entries that have not been saved yet to the history file."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            self.save_history(pending)
 
-    def save_history(self):
-        """Save history to file."""
-        with open(self.history_file, 'w') as f:
-            json.dump(self.history, f, indent=4)
+    def _schedule_flush(self):
+        """Schedule a batched flush unless one is already pending (caller holds the lock)."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
 
     def add_entry(self, operation, details):
         """Add a new history entry."""
@@ -54,27 +174,84 @@ class HistoryManager:
             "operation": operation,
             "details": details
         }
-        self.history.append(entry)
-        self.save_history()
+        with self._lock:
+            self._append_columns([entry])
+            self._pending.append(entry)
+            self._schedule_flush()
 
-    def get_history(self):
-        """Get all history entries."""
-        return self.history
+    def _append_columns(self, entries):
+        """Add entries to the in-memory history columns."""
+        self.timestamps.extend(entry["timestamp"] for entry in entries)
+        self.operations.extend(entry["operation"] for entry in entries)
+        self.details.extend(entry["details"] for entry in entries)
+
+    def get_history(self, start=0):
+        """Get history rows as (timestamp, operation, details) tuples, optionally skipping the first start rows."""
+        return zip(self.timestamps[start:], self.operations[start:], self.details[start:])
 
 class SteganographyApp:
     """Main application class for the steganography GUI."""
+    # Active button styling - darker green background, not clickable, text stays white
+    _ACTIVE_STYLE = {
+        "fg_color": "#2E7D32",
+        "hover_color": "#2E7D32",
+        "text_color": "white",
+        "state": "disabled",
+        "text_color_disabled": "white"
+    }
+    # Normal button styling - lighter green, clickable
+    _NORMAL_STYLE = {
+        "fg_color": "#4CAF50",
+        "hover_color": "#388E3C",
+        "text_color": "white",
+        "state": "normal"
+    }
+    # Data file limits shared by the drop and load handlers of both tabs
+    MAX_TOTAL_DATA_SIZE = 500 * 1024 * 1024  # 500 MB total
+    MAX_IMAGE_DATA_FILE_SIZE = 100 * 1024 * 1024  # 100 MB per file for images
+    MAX_GIF_DATA_FILE_SIZE = 500 * 1024 * 1024  # 500 MB per file for GIFs
+    # Carrier extension matchers, compiled once for the drop and validation paths
+    _IMG_RE = re.compile(r'\.(png|jpe?g)$', re.I)
+    _GIF_RE = re.compile(r'\.gif$', re.I)
+    # Characters dropped from extracted GIF filenames; \w keeps the same Unicode letters and digits as str.isalnum()
+    _UNSAFE_FILENAME_RE = re.compile(r'[^\w.-]+')
+    # LSB entropy score thresholds and the carrier rating for each band between them
+    _ENTROPY_BANDS = (70, 85, 95)
+    _ENTROPY_LABELS = (
+        "❌ Poor carrier – LSBs too predictable",
+        "⚠️ Fair carrier – Consider a more random image",
+        "🟡 Good carrier",
+        "✅ Excellent carrier image",
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title("HideNSeek")
         self.root.geometry("900x700")
+        # Shared font objects, so Tk resolves each font once instead of parsing a tuple per widget
+        self.fonts = {
+            "title": ctk.CTkFont("Helvetica", 20, "bold"),
+            "heading": ctk.CTkFont("Helvetica", 16, "bold"),
+            "label": ctk.CTkFont("Helvetica", 15, "bold"),
+            "status": ctk.CTkFont("Helvetica", 14, "bold"),
+            "entry": ctk.CTkFont("Helvetica", 14, "normal"),
+            "button_large": ctk.CTkFont("Helvetica", button_size + 2, "bold"),
+            "button": ctk.CTkFont("Helvetica", button_size, "bold"),
+            "small": ctk.CTkFont("Helvetica", 12, "bold"),
+            "note": ctk.CTkFont("Helvetica", 12, slant="italic"),
+        }
 
         # Load and set the application icon
+        self.logo_image = None  # Decoded once here and reused for the sidebar logo
         icon_path = os.path.join("assets", "logo.png")
         if os.path.exists(icon_path):
             try:
+                with Image.open(icon_path) as icon_image:
+                    self.logo_image = icon_image.copy()
+                # Shrink the 1024px source once; 256px still covers the 120px sidebar logo at 2x DPI scaling
+                self.logo_image.thumbnail((256, 256))
                 # For taskbar icon we still need to use PhotoImage
-                icon_image = Image.open(icon_path)
-                icon_photo = ImageTk.PhotoImage(icon_image)
+                icon_photo = ImageTk.PhotoImage(self.logo_image)
                 self.root.iconphoto(True, icon_photo)
                 print(f"Successfully loaded icon from {icon_path}")
             except Exception as e:
@@ -91,9 +268,11 @@ class SteganographyApp:
         self.root.resizable(False, False)
         
         self.image_logic = SteganographyLogic()
-        print("Available methods in SteganographyLogic:", dir(self.image_logic))
         self.gif_logic = GIFSteganographyLogic()
-        print("Available methods in SteganographyLogic:", dir(self.gif_logic))
+        # dir() is only worth building when debug logging is actually on
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Available methods in SteganographyLogic: %s", dir(self.image_logic))
+            logging.debug("Available methods in GIFSteganographyLogic: %s", dir(self.gif_logic))
         self.history_manager = HistoryManager()
         self.carrier_image_path = None
         self.carrier_gif_path = None
@@ -107,7 +286,21 @@ class SteganographyApp:
         self.carrier_gif_hash = None
         self.image_load_lock = threading.Lock()
         self.gif_load_lock = threading.Lock()
+        self._hash_cache = {}  # (path, mtime_ns, size) -> carrier digest
+        self._lsb_entropy_cache = OrderedDict()  # carrier digest -> entropy message, most recent last
+        self._entropy_generation = 0  # Bumped per image load so stale entropy results are dropped
+        # Shared worker pool for carrier loads so repeated drops reuse threads instead of spawning new ones
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="hns-io")
+        self._closing = False  # Set on window close so pool jobs stop posting to Tk
+        self._save_future = None  # Pending stego PNG write, if any
+        # Single long-lived worker that runs embed/extract/metadata operations one at a time
+        self._work_q = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
         self.MAX_FILES_SELECTION = 20
+        self._button_states = {}  # Last style applied to each sidebar button
+        # Last percentage drawn on each progress bar and when, used to drop redundant redraws
+        self._last_progress, self._last_progress_t = -1, 0.0
+        self._last_gif_progress, self._last_gif_progress_t = -1, 0.0
 
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("dark-blue")
@@ -125,26 +318,25 @@ class SteganographyApp:
         self.sidebar_frame = ctk.CTkFrame(self.main_frame, width=200, corner_radius=0)
         self.sidebar_frame.pack(side="left", fill="y")
 
-        # Load and display the logo
-        logo_path = os.path.join("assets", "logo.png")
-        if os.path.exists(logo_path):
+        # Display the logo decoded for the window icon
+        if self.logo_image is not None:
             try:
                 # Use CTkImage for better HighDPI support
                 logo_image = ctk.CTkImage(
-                    light_image=Image.open(logo_path),
-                    dark_image=Image.open(logo_path),
+                    light_image=self.logo_image,
+                    dark_image=self.logo_image,
                     size=(120, 120)
                 )
                 
                 # Create and pack the logo label
                 logo_label = ctk.CTkLabel(self.sidebar_frame, image=logo_image, text="")
                 logo_label.pack(pady=(20, 10))
-                print(f"Successfully loaded sidebar logo from {logo_path}")
+                print("Successfully loaded sidebar logo")
             except Exception as e:
                 print(f"Error loading sidebar logo: {e}")
 
         # Add app title below the logo
-        ctk.CTkLabel(self.sidebar_frame, text="HideNSeek", font=("Helvetica", 20, "bold")).pack(pady=(0, 20))
+        ctk.CTkLabel(self.sidebar_frame, text="HideNSeek", font=self.fonts["title"]).pack(pady=(0, 20))
 
         # Create a top frame for main feature buttons (takes most of the sidebar space)
         top_button_frame = ctk.CTkFrame(self.sidebar_frame, fg_color="transparent")
@@ -158,7 +350,7 @@ class SteganographyApp:
             top_button_frame, text="Image-Stego", 
             command=lambda: self.show_frame("image_stego"),
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C",
-            font=("Helvetica", button_size + 2, "bold"),
+            font=self.fonts["button_large"],
             height=55,  # Ensure exact same height
             width=160   # Same width
         )
@@ -168,7 +360,7 @@ class SteganographyApp:
             top_button_frame, text="GIF-Stego", 
             command=lambda: self.show_frame("gif_stego"),
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C",
-            font=("Helvetica", button_size + 2, "bold"),
+            font=self.fonts["button_large"],
             height=55,  # Ensure exact same height
             width=160   # Same width
         )
@@ -187,7 +379,7 @@ class SteganographyApp:
             bottom_button_frame, text="History", 
             command=lambda: self.show_frame("history"),
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C",
-            font=("Helvetica", 15, "bold"),
+            font=self.fonts["label"],
             width=140
         )
         self.sidebar_buttons["history"].pack(pady=7, fill="x")
@@ -196,7 +388,7 @@ class SteganographyApp:
             bottom_button_frame, text="Help", 
             command=self.show_help,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C",
-            font=("Helvetica", 15, "bold"),
+            font=self.fonts["label"],
             width=140
         )
         self.sidebar_buttons["help"].pack(pady=5, fill="x")
@@ -205,26 +397,37 @@ class SteganographyApp:
         self.content_frame.pack(side="left", fill="both", expand=True, padx=20, pady=20)
 
         self.frames = {}
-        self.setup_image_stego_frame()
-        self.setup_gif_stego_frame()
-        self.setup_history_frame()
+        # Pages are built the first time they are shown so startup only pays for Image-Stego
+        self._frame_builders = {
+            "image_stego": self.setup_image_stego_frame,
+            "gif_stego": self.setup_gif_stego_frame,
+            "history": self.setup_history_frame
+        }
 
         # Ensure the active frame is set and displayed
-        print("Setting up GUI: Initializing frames...")
-        print(f"Available frames: {list(self.frames.keys())}")
+        logging.debug("Setting up GUI: Initializing frames...")
+        logging.debug("Available frames: %s", list(self._frame_builders))
         self.active_frame = None  # Reset active frame to force display
         self.show_frame("image_stego")
-        print(f"Displayed frame: {self.active_frame}")
+        logging.debug("Displayed frame: %s", self.active_frame)
         
         # Force a GUI update to ensure rendering
         self.root.update_idletasks()
 
+        # Move the long-lived startup objects (widgets, fonts, logic) out of the
+        # collector's reach so later collections don't keep rescanning them
+        gc.freeze()
+
     def show_frame(self, frame_name):
         """Show the specified frame in the content area and update sidebar button styles."""
         # Don't do anything if clicking the already active tab
         if hasattr(self, 'active_frame') and self.active_frame == frame_name:
             return
             
+        # Build the frame on first use
+        if frame_name not in self.frames:
+            self._frame_builders[frame_name]()
+
         # Hide all frames
         for frame in self.frames.values():
             frame.pack_forget()
@@ -235,25 +438,13 @@ class SteganographyApp:
         # Update active frame tracking
         self.active_frame = frame_name
         
-        # Reset all sidebar button styles
+        # Restyle only the sidebar buttons whose active/normal state actually changed
         for name, button in self.sidebar_buttons.items():
-            if name == frame_name:
-                # Active button styling - darker green background (same as image)
-                button.configure(
-                    fg_color="#2E7D32",  # Darker green for active tab
-                    hover_color="#2E7D32",  # Don't change on hover when active
-                    text_color="white",
-                    state="disabled",  # Disable clicking on active tab
-                    text_color_disabled="white"  # Keep text white when disabled
-                )
-            else:
-                # Normal button styling - lighter green like in your image
-                button.configure(
-                    fg_color="#4CAF50",  
-                    hover_color="#388E3C", 
-                    text_color="white",
-                    state="normal"  # Enable clicking on inactive tabs
-                )
+            state = "active" if name == frame_name else "normal"
+            if self._button_states.get(name) == state:
+                continue
+            self._button_states[name] = state
+            button.configure(**(self._ACTIVE_STYLE if state == "active" else self._NORMAL_STYLE))
             
     def setup_image_stego_frame(self):
         """Setup the Image-Stego frame with all steganography features."""
@@ -267,7 +458,7 @@ class SteganographyApp:
         self.image_section = ctk.CTkFrame(scrollable_frame, corner_radius=10)
         self.image_section.pack(fill="x", pady=5)
 
-        ctk.CTkLabel(self.image_section, text="Carrier Image", font=main_font).pack(pady=(10, 10))
+        ctk.CTkLabel(self.image_section, text="Carrier Image", font=self.fonts["title"]).pack(pady=(10, 10))
         
         self.image_button_frame = ctk.CTkFrame(self.image_section, fg_color="transparent")
         self.image_button_frame.pack(pady=(0, 10))
@@ -275,11 +466,11 @@ class SteganographyApp:
         self.load_image_button = ctk.CTkButton(
             self.image_button_frame, text="Browse Image", command=self.load_carrier_image,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C", width=button_width , 
-            font=("Helvetica", button_size , "bold") 
+            font=self.fonts["button"] 
         )
         self.load_image_button.pack(side="left", padx=(0, 0))
         
-        self.carrier_image_status = ctk.CTkLabel(self.image_section, text="No image selected", text_color="red", font=("Helvetica", 14, "bold"))
+        self.carrier_image_status = ctk.CTkLabel(self.image_section, text="No image selected", text_color="red", font=self.fonts["status"])
         self.carrier_image_status.pack(pady=(0, button_pady))
         
         self.image_section.drop_target_register(DND_FILES)
@@ -288,15 +479,15 @@ class SteganographyApp:
         self.data_section = ctk.CTkFrame(scrollable_frame, corner_radius=10)
         self.data_section.pack(fill="x", pady=5)
 
-        ctk.CTkLabel(self.data_section, text="Data to Hide", font=main_font).pack(pady=(10, 10))
+        ctk.CTkLabel(self.data_section, text="Data to Hide", font=self.fonts["title"]).pack(pady=(10, 10))
 
         self.load_data_button = ctk.CTkButton(
             self.data_section, text="Browse Files", command=self.load_data_file,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C" , width=button_width ,
-            font=("Helvetica", button_size , "bold")
+            font=self.fonts["button"]
         )
         self.load_data_button.pack(pady=5)
-        self.data_file_status = ctk.CTkLabel(self.data_section, text="No Files Selected", text_color="red" , font=("Helvetica", 14, "bold"))
+        self.data_file_status = ctk.CTkLabel(self.data_section, text="No Files Selected", text_color="red" , font=self.fonts["status"])
         self.data_file_status.pack(pady=5)
         self.data_section.drop_target_register(DND_FILES)
         self.data_section.dnd_bind('<<Drop>>', self.drop_data_file)
@@ -304,7 +495,7 @@ class SteganographyApp:
         self.key_section = ctk.CTkFrame(scrollable_frame, corner_radius=10)
         self.key_section.pack(fill="x", pady=5)
 
-        ctk.CTkLabel(self.key_section, text="Encryption Key", font=main_font).pack(pady=(10, 10))
+        ctk.CTkLabel(self.key_section, text="Encryption Key", font=self.fonts["title"]).pack(pady=(10, 10))
         
         self.generate_key_frame = ctk.CTkFrame(self.key_section, fg_color="transparent")
         self.generate_key_frame.pack(pady=2)
@@ -313,7 +504,7 @@ class SteganographyApp:
             self.generate_key_frame, 
             width=300, 
             placeholder_text="Enter or generate a key",
-            font=("Helvetica", 14, "normal"),
+            font=self.fonts["entry"],
             state="disabled" , 
             show="*"
         )
@@ -327,13 +518,13 @@ class SteganographyApp:
             fg_color="#4CAF50",
             hover_color="#388E3C",
             width=button_width,
-            font=("Helvetica", button_size, "bold"),
+            font=self.fonts["button"],
             state="disabled",
             text_color_disabled="#8fbf8f"
         )
         self.generate_key_button.pack(pady=(button_pady, button_pady))
         self.estimates_label = ctk.CTkLabel(
-            self.key_section, text="", font=("Helvetica", 12, "italic"),
+            self.key_section, text="", font=self.fonts["note"],
             text_color="#66BB6A", wraplength=300, justify="left", anchor="w"
         )
         self.estimates_label.pack_forget()
@@ -341,10 +532,10 @@ class SteganographyApp:
         self.auth_section = ctk.CTkFrame(scrollable_frame, corner_radius=10)
         self.auth_section.pack(fill="x", pady=5)
 
-        ctk.CTkLabel(self.auth_section, text="Authentication", font=main_font).pack(pady=(10, 10))
-        self.password_entry = ctk.CTkEntry(self.auth_section, show="*", width=300, state = "disabled" , placeholder_text="Enter password (optional)" , font=("Helvetica", 14, "normal"))
+        ctk.CTkLabel(self.auth_section, text="Authentication", font=self.fonts["title"]).pack(pady=(10, 10))
+        self.password_entry = ctk.CTkEntry(self.auth_section, show="*", width=300, state = "disabled" , placeholder_text="Enter password (optional)" , font=self.fonts["entry"])
         self.password_entry.pack(pady=(0, button_pady))
-        self.author_entry = ctk.CTkEntry(self.auth_section, width=300, state = "disabled" , placeholder_text="Enter author name (optional)" , font=("Helvetica", 14, "normal"))
+        self.author_entry = ctk.CTkEntry(self.auth_section, width=300, state = "disabled" , placeholder_text="Enter author name (optional)" , font=self.fonts["entry"])
         self.author_entry.pack(pady=(button_pady, 20))
 
         self.action_frame = ctk.CTkFrame(scrollable_frame, corner_radius=10)
@@ -359,7 +550,7 @@ class SteganographyApp:
         self.embed_button = ctk.CTkButton(
             center_frame, text="Embed Data", command=self.start_embed,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C", width=button_width,
-            font=("Helvetica", button_size, "bold") , state = "disabled" ,
+            font=self.fonts["button"] , state = "disabled" ,
             text_color_disabled="#8fbf8f"
         )
         self.embed_button.pack(side="left", padx=10)
@@ -367,7 +558,7 @@ class SteganographyApp:
         self.extract_button = ctk.CTkButton(
             center_frame, text="Extract Data", command=self.start_extract,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C", width=button_width,
-            font=("Helvetica", button_size, "bold") , state = "disabled" ,
+            font=self.fonts["button"] , state = "disabled" ,
             text_color_disabled="#8fbf8f"
         )
         self.extract_button.pack(side="left", padx=10)
@@ -375,7 +566,7 @@ class SteganographyApp:
         self.metadata_button = ctk.CTkButton(
             center_frame, text="View Metadata", command=self.start_view_metadata,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C", width=button_width,
-            font=("Helvetica", button_size, "bold") , state = "disabled" ,
+            font=self.fonts["button"] , state = "disabled" ,
             text_color_disabled="#8fbf8f"
         )
         self.metadata_button.pack(side="left", padx=10)
@@ -384,7 +575,7 @@ class SteganographyApp:
         self.progress_frame.pack(fill="x", pady=5)
 
         self.progress_label = ctk.CTkLabel(
-            self.progress_frame, text="Progress: 0%", font=("Helvetica", 12, "bold"), text_color="#66BB6A"
+            self.progress_frame, text="Progress: 0%", font=self.fonts["small"], text_color="#66BB6A"
         )
         self.progress_label.pack(pady=(5, 2))
         self.progress = ctk.CTkProgressBar(
@@ -406,7 +597,7 @@ class SteganographyApp:
         self.gif_section = ctk.CTkFrame(scrollable_frame, corner_radius=10)
         self.gif_section.pack(fill="x", pady=5)
 
-        ctk.CTkLabel(self.gif_section, text="Carrier GIF", font=main_font).pack(pady=(10, 10))
+        ctk.CTkLabel(self.gif_section, text="Carrier GIF", font=self.fonts["title"]).pack(pady=(10, 10))
         
         self.gif_button_frame = ctk.CTkFrame(self.gif_section, fg_color="transparent")
         self.gif_button_frame.pack(pady=(0, 10))
@@ -414,12 +605,12 @@ class SteganographyApp:
         self.load_gif_button = ctk.CTkButton(
             self.gif_button_frame, text="Browse GIF", command=self.load_carrier_gif,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C", width=button_width,
-            font=("Helvetica", button_size, "bold")
+            font=self.fonts["button"]
         )
         self.load_gif_button.pack(side="left", padx=(0, 0))
         
         self.carrier_gif_status = ctk.CTkLabel(self.gif_section, text="No GIF selected", text_color="red", 
-                                            font=("Helvetica", 14, "bold"))
+                                            font=self.fonts["status"])
         self.carrier_gif_status.pack(pady=(0, button_pady))
         
         # Make the entire GIF section a drop target
@@ -430,17 +621,17 @@ class SteganographyApp:
         self.gif_data_section = ctk.CTkFrame(scrollable_frame, corner_radius=10)
         self.gif_data_section.pack(fill="x", pady=5)
 
-        ctk.CTkLabel(self.gif_data_section, text="Data to Hide", font=main_font).pack(pady=(10, 10))
+        ctk.CTkLabel(self.gif_data_section, text="Data to Hide", font=self.fonts["title"]).pack(pady=(10, 10))
         
         self.load_gif_data_button = ctk.CTkButton(
             self.gif_data_section, text="Browse Files", command=self.load_gif_data_file,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C", width=button_width,
-            font=("Helvetica", button_size, "bold")
+            font=self.fonts["button"]
         )
         self.load_gif_data_button.pack(pady=5)
         
         self.gif_data_file_status = ctk.CTkLabel(self.gif_data_section, text="No Files Selected", 
-                                            text_color="red", font=("Helvetica", 14, "bold"))
+                                            text_color="red", font=self.fonts["status"])
         self.gif_data_file_status.pack(pady=5)
         
         # Make the entire data section a drop target
@@ -451,7 +642,7 @@ class SteganographyApp:
         self.gif_key_section = ctk.CTkFrame(scrollable_frame, corner_radius=10)
         self.gif_key_section.pack(fill="x", pady=5)
 
-        ctk.CTkLabel(self.gif_key_section, text="Encryption Key", font=main_font).pack(pady=(10, 10))
+        ctk.CTkLabel(self.gif_key_section, text="Encryption Key", font=self.fonts["title"]).pack(pady=(10, 10))
         
         self.gif_generate_key_frame = ctk.CTkFrame(self.gif_key_section, fg_color="transparent")
         self.gif_generate_key_frame.pack(pady=2)
@@ -460,7 +651,7 @@ class SteganographyApp:
             self.gif_generate_key_frame,
             width=300,
             placeholder_text="Enter or generate a key",
-            font=("Helvetica", 14, "normal"),
+            font=self.fonts["entry"],
             state="disabled" , 
             show="*"
         )
@@ -475,7 +666,7 @@ class SteganographyApp:
             fg_color="#4CAF50",
             hover_color="#388E3C",
             width=button_width,
-            font=("Helvetica", button_size, "bold"),
+            font=self.fonts["button"],
             state="disabled",
             text_color_disabled="#8fbf8f"
         )
@@ -485,16 +676,16 @@ class SteganographyApp:
         self.gif_auth_section = ctk.CTkFrame(scrollable_frame, corner_radius=10)
         self.gif_auth_section.pack(fill="x", pady=5)
 
-        ctk.CTkLabel(self.gif_auth_section, text="Authentication", font=main_font).pack(pady=(10, 10))
+        ctk.CTkLabel(self.gif_auth_section, text="Authentication", font=self.fonts["title"]).pack(pady=(10, 10))
         
         self.gif_password_entry = ctk.CTkEntry(self.gif_auth_section, show="*", width=300, 
                                             placeholder_text="Enter password (optional)",
-                                            font=("Helvetica", 14, "normal") ,state="disabled")
+                                            font=self.fonts["entry"] ,state="disabled")
         self.gif_password_entry.pack(pady=(0, button_pady))
         
         self.gif_author_entry = ctk.CTkEntry(self.gif_auth_section, width=300, 
                                         placeholder_text="Enter author name (optional)",
-                                        font=("Helvetica", 14, "normal") , state="disabled")
+                                        font=self.fonts["entry"] , state="disabled")
         self.gif_author_entry.pack(pady=(button_pady, 20))
 
         # Action Section with centered buttons
@@ -512,7 +703,7 @@ class SteganographyApp:
         self.gif_embed_button = ctk.CTkButton(
             gif_center_frame, text="Embed Data", command=self.start_gif_embed,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C", width=button_width,
-            font=("Helvetica", button_size, "bold"), state="disabled",
+            font=self.fonts["button"], state="disabled",
             text_color_disabled="#8fbf8f"
         )
         self.gif_embed_button.pack(side="left", padx=10)
@@ -520,7 +711,7 @@ class SteganographyApp:
         self.gif_extract_button = ctk.CTkButton(
             gif_center_frame, text="Extract Data", command=self.start_gif_extract,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C", width=button_width,
-            font=("Helvetica", button_size, "bold"), state="disabled",
+            font=self.fonts["button"], state="disabled",
             text_color_disabled="#8fbf8f"
         )
         self.gif_extract_button.pack(side="left", padx=10)
@@ -528,7 +719,7 @@ class SteganographyApp:
         self.gif_metadata_button = ctk.CTkButton(
             gif_center_frame, text="View Metadata", command=self.start_gif_view_metadata,
             corner_radius=8, fg_color="#4CAF50", hover_color="#388E3C", width=button_width,
-            font=("Helvetica", button_size, "bold"), state="disabled",
+            font=self.fonts["button"], state="disabled",
             text_color_disabled="#8fbf8f"
         )
         self.gif_metadata_button.pack(side="left", padx=10)
@@ -538,7 +729,7 @@ class SteganographyApp:
         self.gif_progress_frame.pack(fill="x", pady=5)
 
         self.gif_progress_label = ctk.CTkLabel(
-            self.gif_progress_frame, text="Progress: 0%", font=("Helvetica", 12, "bold"), text_color="#66BB6A"
+            self.gif_progress_frame, text="Progress: 0%", font=self.fonts["small"], text_color="#66BB6A"
         )
         self.gif_progress_label.pack(pady=(5, 2))
         
@@ -554,7 +745,7 @@ class SteganographyApp:
         frame = ctk.CTkFrame(self.content_frame, corner_radius=10)
         self.frames["history"] = frame
 
-        ctk.CTkLabel(frame, text="Operation History", font=("Helvetica", 16, "bold")).pack(pady=10)
+        ctk.CTkLabel(frame, text="Operation History", font=self.fonts["heading"]).pack(pady=10)
 
         # Create a frame to hold the Treeview with both scrollbars
         tree_frame = ctk.CTkFrame(frame)
@@ -609,6 +800,7 @@ class SteganographyApp:
         # Make sure horizontal scrolling is enabled and showing all columns
         self.history_tree.configure(displaycolumns=("Timestamp", "Operation", "Details"))
 
+        self._history_inserted = 0  # History entries already shown in the tree
         self.update_history_view()
 
     def show_help(self):
@@ -628,7 +820,7 @@ class SteganographyApp:
         self.key = self.image_logic.generate_key()
         self.key_entry.delete(0, "end")
         self.key_entry.insert(0, self.key)
-        pyperclip.copy(self.key)
+        self.copy_to_clipboard(self.key)
         messagebox.showinfo("Key Generated", "Key copied to clipboard.")
         self.history_manager.add_entry("Key Generation", "Generated a new encryption key for Image-Stego.")
 
@@ -639,28 +831,83 @@ class SteganographyApp:
         self.key = self.gif_logic.generate_key()
         self.gif_key_entry.delete(0, "end")
         self.gif_key_entry.insert(0, self.key)
-        pyperclip.copy(self.key)
+        self.copy_to_clipboard(self.key)
         messagebox.showinfo("Key Generated", "Key copied to clipboard.")
         self.history_manager.add_entry("Key Generation", "Generated a new encryption key for GIF-Stego.")
 
+    def copy_to_clipboard(self, text):
+        """Copy text to the clipboard through Tk instead of an external helper process."""
+        self.root.clipboard_clear()
+        self.root.clipboard_append(text)
+
     def analyze_lsb_entropy(self, image_path):
         """Analyze LSB entropy of an image to determine its suitability as a carrier."""
-        img = Image.open(image_path).convert("RGB")
-        pixels = np.array(img)
-        flat = pixels.flatten()
-        lsb_bits = flat & 1
-        ratio = np.sum(lsb_bits) / lsb_bits.size
+        # The result depends only on the file contents, so reuse it for a carrier already scanned
+        digest = self._carrier_hash(image_path)
+        cached = self._lsb_entropy_cache.get(digest)
+        if cached is not None:
+            self._lsb_entropy_cache.move_to_end(digest)
+            return cached
+        message = self._compute_lsb_entropy(image_path)
+        self._lsb_entropy_cache[digest] = message
+        if len(self._lsb_entropy_cache) > 8:
+            self._lsb_entropy_cache.popitem(last=False)
+        return message
+
+    def _compute_lsb_entropy(self, image_path):
+        """Scan an image's LSBs and describe how suitable it is as a carrier."""
+        with Image.open(image_path) as img:
+            width, height = img.size
+            ones = scanned = 0
+            # Scan 512-row bands over PIL's own buffer so no full-size ndarray copy is ever made.
+            # The first crop still decodes the whole file; sampling only bounds the copying and counting.
+            # The score is a statistic, so large images sample at most 8 evenly spaced bands; rows are
+            # skipped rather than downscaled because draft()/reduce() would average away the real LSBs.
+            bands = range(0, height, 512)
+            for top in bands[::-(-len(bands) // 8)]:
+                band = img.crop((0, top, width, min(top + 512, height)))
+                if band.mode != "RGB":
+                    band = band.convert("RGB")
+                ones += _count_lsb_ones(np.frombuffer(band.tobytes(), dtype=np.uint8))
+                scanned += band.width * band.height * 3
+        ratio = ones / scanned
         deviation = abs(0.5 - ratio) * 2
         entropy_score = (1 - deviation) * 100
-
-        if entropy_score >= 95:
-            return f"✅ Excellent carrier image (LSB Entropy: {entropy_score:.2f}%)"
-        elif entropy_score >= 85:
-            return f"🟡 Good carrier (LSB Entropy: {entropy_score:.2f}%)"
-        elif entropy_score >= 70:
-            return f"⚠️ Fair carrier – Consider a more random image (LSB Entropy: {entropy_score:.2f}%)"
-        else:
-            return f"❌ Poor carrier – LSBs too predictable (LSB Entropy: {entropy_score:.2f}%)"
+        label = self._ENTROPY_LABELS[bisect.bisect_right(self._ENTROPY_BANDS, entropy_score)]
+        return f"{label} (LSB Entropy: {entropy_score:.2f}%)"
+
+    def _carrier_hash(self, path):
+        """Return the carrier digest, re-hashing only when the file's size or mtime has changed."""
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        digest = self._hash_cache.get(key)
+        if digest is None:
+            if len(self._hash_cache) >= 16:
+                self._hash_cache.clear()
+            digest = self._hash_cache[key] = _file_hash(path)
+        return digest
+
+    def _verify_unmodified(self, path, expected):
+        """Check that the carrier on disk still matches the digest recorded when it was loaded."""
+        return self._carrier_hash(path) == expected
+
+    def _on_ui(self, fn, *args):
+        """Run a callable on the Tk thread, in order with other after(0) callbacks such as reset_fields."""
+        self.root.after(0, fn, *args)
+
+    def _post_from_pool(self, fn, *args):
+        """Queue a callable on the Tk thread from an I/O pool job, unless the window is closing."""
+        if not self._closing:
+            self.root.after(0, fn, *args)
+
+    def _worker_loop(self):
+        """Run queued operations one at a time on a single long-lived thread."""
+        while True:
+            fn, args = self._work_q.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                logging.error(f"Background operation failed: {str(e)}")
 
     def drop_carrier_image(self, event):
         """Handle dropped files for carrier image."""
@@ -674,14 +921,14 @@ class SteganographyApp:
             return
 
         file_path = files[0]
-        if not file_path.lower().endswith(('.png', '.jpg', '.jpeg')):
+        if not self._IMG_RE.search(file_path):
             messagebox.showerror("Carrier Fail", "Please Drop a PNG, JPG, or JPEG File.")
             return
 
         self.carrier_image_path = file_path
         self.carrier_image_status.configure(text="Loading...", text_color="yellow")
         self.load_image_button.configure(state="disabled")
-        threading.Thread(target=self._load_carrier_image, daemon=True).start()
+        self._io_pool.submit(self._load_carrier_image)
 
     def load_carrier_image(self, file_path=None):
         """Load the carrier image and compute its hash for integrity."""
@@ -702,131 +949,121 @@ class SteganographyApp:
         print(f"Carrier image path: {self.carrier_image_path}")
         self.carrier_image_status.configure(text="Loading...", text_color="yellow")
         self.load_image_button.configure(state="disabled")
-        threading.Thread(target=self._load_carrier_image, daemon=True).start()
+        self._io_pool.submit(self._load_carrier_image)
     
     def _load_carrier_image(self):
         """Load the carrier image and compute its hash."""
         with self.image_load_lock:
             try:
-                with open(self.carrier_image_path, "rb") as f:
-                    self.carrier_image_hash = hashlib.sha256(f.read()).hexdigest()
+                self.carrier_image_hash = self._carrier_hash(self.carrier_image_path)
+                # Image.open parses only the header, so a file that isn't an image fails the load before the page is enabled
+                Image.open(self.carrier_image_path).close()
                 
                 # Get the filename from the path
                 filename = os.path.basename(self.carrier_image_path)
                 
-                # First show the filename that was selected
-                self.root.after(0, lambda fname=filename: self.carrier_image_status.configure(
-                    text=f"Image selected: {fname}", 
-                    text_color="green"
-                ))
-                
-                # Create a frame to hold multiple status messages if it doesn't exist
-                if not hasattr(self, 'entropy_label'):
-                    self.entropy_label = ctk.CTkLabel(
-                        self.image_section, 
-                        text="", 
-                        text_color="orange", 
-                        font=("Helvetica", 12, "bold")
-                    )
-                
-                try:
-                    # First, show the label if it was previously hidden
-                    self.entropy_label.pack(pady=(0, button_pady))
-                except:
-                    self.entropy_label.pack_forget()
-                    self.entropy_label.pack(pady=(0, button_pady))
-                
-                # Then analyze LSB randomness and display it in the separate label
-                entropy_msg = self.analyze_lsb_entropy(self.carrier_image_path)
-                self.root.after(0, lambda msg=entropy_msg: self.entropy_label.configure(
-                    text=msg, 
-                    text_color="orange"
-                ))
-                print(f"LSB Entropy Analysis: {entropy_msg}")
-                
-                # Enable all action buttons when an image is successfully loaded
-                self.root.after(0, lambda: self.embed_button.configure(state="normal"))
-                self.root.after(0, lambda: self.extract_button.configure(state="normal"))
-                self.root.after(0, lambda: self.metadata_button.configure(state="normal"))
-                self.root.after(0, lambda: self.generate_key_button.configure(state="normal"))
-                
-                # Enable the key entry and authentication fields with updated placeholders
-                self.root.after(0, lambda: self.key_entry.configure(
-                    state="normal", 
-                    placeholder_text="Enter or generate a key", 
-                    show="*"
-                ))
-                self.root.after(0, lambda: self.password_entry.configure(
-                    state="normal", 
-                    placeholder_text="Enter password", 
-                    show="*"
-                ))
-                self.root.after(0, lambda: self.author_entry.configure(
-                    state="normal", 
-                    placeholder_text="Enter author name (optional)"
-                ))
+                # Enable the page right away; the LSB scan runs as its own job and fills in the label later
+                self._entropy_generation += 1
+                self._post_from_pool(self._finalize_image_load_ok, filename)
+                self._io_pool.submit(self._entropy_job, self.carrier_image_path, self._entropy_generation)
                 
             except Exception as e:
-                self.root.after(0, lambda e=e: messagebox.showerror("Carrier Fail", "Failed to Load Image"))
-                self.root.after(0, lambda e=e: self.carrier_image_status.configure(text="Failed to Load Image", text_color="red"))
-                self.root.after(0, self.reset_fields)
-                
-            finally:
-                self.root.after(0, lambda: self.load_image_button.configure(state="normal"))
+                self._post_from_pool(self._finalize_image_load_failed)
 
-    def _load_carrier_image_thread(self, new_path):
-        """Thread to load a carrier image."""
+    def _entropy_job(self, image_path, generation):
+        """Analyze LSB randomness in the background and post the result for the carrier it was started for."""
         try:
-            # Verify the image can be opened
-            try:
-                Image.open(new_path).verify()
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Carrier Fail", "Invalid Image File"))
-                # Reset all fields regardless of whether there was a previous image
-                self.root.after(0, self.reset_fields)
-                return
-                
-            # Update the carrier path and start loading
-            self.carrier_image_path = new_path
-            self._load_carrier_image()
-            
+            entropy_msg = self.analyze_lsb_entropy(image_path)
         except Exception as e:
-            logging.error("Failed to load carrier image")
-            self.root.after(0, lambda: messagebox.showerror("Carrier Fail", "Failed to Load Image"))
-            # Reset all fields regardless of whether there was a previous image
-            self.root.after(0, self.reset_fields)
-        finally:
-            self.root.after(0, lambda: self.load_image_button.configure(state="normal"))
+            logging.error(f"LSB entropy analysis failed: {str(e)}")
+            self._post_from_pool(self._apply_entropy_failed, generation)
+            return
+        print(f"LSB Entropy Analysis: {entropy_msg}")
+        self._post_from_pool(self._apply_entropy_label, entropy_msg, generation)
+
+    def _apply_entropy_label(self, entropy_msg, generation):
+        """Show an entropy result unless a newer carrier has been loaded since."""
+        if generation == self._entropy_generation:
+            self.entropy_label.configure(text=entropy_msg, text_color="orange")
+
+    def _apply_entropy_failed(self, generation):
+        """Report a failed entropy scan on the label only; an operation may already be running on this carrier."""
+        if generation == self._entropy_generation:
+            self.entropy_label.configure(text="LSB entropy analysis failed", text_color="red")
+
+    def _finalize_image_load_ok(self, filename):
+        """Apply all UI updates for a successfully loaded carrier image."""
+        # First show the filename that was selected
+        self.carrier_image_status.configure(text=f"Image selected: {filename}", text_color="green")
+        
+        # Create a frame to hold multiple status messages if it doesn't exist
+        if not hasattr(self, 'entropy_label'):
+            self.entropy_label = ctk.CTkLabel(
+                self.image_section, 
+                text="", 
+                text_color="orange", 
+                font=self.fonts["small"]
+            )
+        
+        try:
+            # First, show the label if it was previously hidden
+            self.entropy_label.pack(pady=(0, button_pady))
+        except:
+            self.entropy_label.pack_forget()
+            self.entropy_label.pack(pady=(0, button_pady))
+        self.entropy_label.configure(text="Analyzing…", text_color="orange")
+        
+        # Enable all action buttons when an image is successfully loaded
+        self.embed_button.configure(state="normal")
+        self.extract_button.configure(state="normal")
+        self.metadata_button.configure(state="normal")
+        self.generate_key_button.configure(state="normal")
+        
+        # Enable the key entry and authentication fields with updated placeholders
+        self.key_entry.configure(state="normal", placeholder_text="Enter or generate a key", show="*")
+        self.password_entry.configure(state="normal", placeholder_text="Enter password", show="*")
+        self.author_entry.configure(state="normal", placeholder_text="Enter author name (optional)")
+        self.load_image_button.configure(state="normal")
 
-    def drop_data_file(self, event):
-        """Handle dropped files for data to hide in Image-Stego."""
-        MAX_FILES = 20
-        MAX_FILE_SIZE = 100 * 1024 * 1024  # 100 MB per file for images
-        MAX_TOTAL_SIZE = 500 * 1024 * 1024  # 500 MB total
+    def _finalize_image_load_failed(self):
+        """Apply all UI updates for a carrier image that failed to load."""
+        messagebox.showerror("Carrier Fail", "Failed to Load Image")
+        self.carrier_image_status.configure(text="Failed to Load Image", text_color="red")
+        self.reset_fields()
+        self.load_image_button.configure(state="normal")
 
-        files = self.root.splitlist(event.data)
-        if len(files) > MAX_FILES:
-            messagebox.showerror("Data Fail", f"You Can Only Select Up to {MAX_FILES} Files at a Time.")
-            return
+    def _validate_data_files(self, paths, max_file_size, source):
+        """Check data files against the count and size limits; return their total size, or None after showing the error."""
+        if len(paths) > self.MAX_FILES_SELECTION:
+            messagebox.showerror("Data Fail", f"You Can Only Select Up to {self.MAX_FILES_SELECTION} Files at a Time.")
+            return None
 
-        # Check file sizes
+        # One stat per file gives the size for both the per-file and the total check
         total_size = 0
         oversized_files = []
-        for path in files:
-            file_size = os.path.getsize(path)
-            if file_size > MAX_FILE_SIZE:
+        for path in paths:
+            file_size = os.stat(path).st_size
+            if file_size > max_file_size:
                 oversized_files.append(f"'{os.path.basename(path)}' ({file_size / (1024*1024):.1f} MB)")
             total_size += file_size
-            if total_size > MAX_TOTAL_SIZE:
-                messagebox.showerror("Data Fail", 
-                    f"Total Size of Dropped Files ({total_size / (1024*1024):.1f} MB) "
-                    f"Exceeds The Maximum Limit of {MAX_TOTAL_SIZE / (1024*1024):.1f} MB")
-                return
+            if total_size > self.MAX_TOTAL_DATA_SIZE:
+                messagebox.showerror("Data Fail",
+                    f"Total Size of {source} Files ({total_size / (1024*1024):.1f} MB) "
+                    f"Exceeds The Maximum Limit of {self.MAX_TOTAL_DATA_SIZE / (1024*1024):.1f} MB")
+                return None
 
         if oversized_files:
-            messagebox.showerror("Error",
-                f"The Following Files Exceed The {MAX_FILE_SIZE / (1024*1024):.1f} MB Per-File Limit:\n\n" +
+            messagebox.showerror("Data Fail",
+                f"The Following Files Exceed The {max_file_size / (1024*1024):.1f} MB Per-File Limit:\n\n" +
                 "\n".join(oversized_files))
+            return None
+        return total_size
+
+    def drop_data_file(self, event):
+        """Handle dropped files for data to hide in Image-Stego."""
+        files = self.root.splitlist(event.data)
+        total_size = self._validate_data_files(files, self.MAX_IMAGE_DATA_FILE_SIZE, "Dropped")
+        if total_size is None:
             return
 
         self.data_file_path = files
@@ -838,41 +1075,13 @@ class SteganographyApp:
 
     def load_data_file(self, file_paths=None):
         """Load data files to embed for image stego."""
-        MAX_FILE_SIZE = 100 * 1024 * 1024  # 100 MB per file for images
-        MAX_TOTAL_SIZE = 500 * 1024 * 1024  # 500 MB total
-        MAX_FILES = 20
-
         if not file_paths:
             self.data_file_path = filedialog.askopenfilenames(filetypes=[("All files", "*.*")])
         else:
             self.data_file_path = file_paths
 
-        if len(self.data_file_path) > MAX_FILES:
-            messagebox.showerror("Data Fail", f"You Can Only Select Up to {MAX_FILES} Files at a Time.")
-            self.data_file_path = []
-            self.data_file_status.configure(text="No Files Selected", text_color="red")
-            return
-
-        # Check file sizes
-        total_size = 0
-        oversized_files = []
-        for path in self.data_file_path:
-            file_size = os.path.getsize(path)
-            if file_size > MAX_FILE_SIZE:
-                oversized_files.append(f"'{os.path.basename(path)}' ({file_size / (1024*1024):.1f} MB)")
-            total_size += file_size
-            if total_size > MAX_TOTAL_SIZE:
-                messagebox.showerror("Data Fail", 
-                    f"Total size of selected files ({total_size / (1024*1024):.1f} MB) "
-                    f"Exceeds The Maximum Limit of {MAX_TOTAL_SIZE / (1024*1024):.1f} MB")
-                self.data_file_path = []
-                self.data_file_status.configure(text="No Files Selected", text_color="red")
-                return
-
-        if oversized_files:
-            messagebox.showerror("Data Fail",
-                f"The Following Files Exceed The {MAX_FILE_SIZE / (1024*1024):.1f} MB Per-File Limit:\n\n" +
-                "\n".join(oversized_files))
+        total_size = self._validate_data_files(self.data_file_path, self.MAX_IMAGE_DATA_FILE_SIZE, "Selected")
+        if total_size is None:
             self.data_file_path = []
             self.data_file_status.configure(text="No Files Selected", text_color="red")
             return
@@ -913,39 +1122,36 @@ class SteganographyApp:
         valid, password, author = self.validate_inputs(self.password_entry, self.author_entry, for_embedding=True)
         if not valid:
             return
-        threading.Thread(target=lambda: self._embed_data_thread(password, author), daemon=True).start()
+        self._work_q.put((self._embed_data_thread, (password, author, key_str)))
 
-    def _embed_data_thread(self, password, author):
+    def _embed_data_thread(self, password, author, key_str):
         """Embed data into the carrier image in a separate thread."""
         self.set_button_state(self.embed_button, "disabled", operation=True)
+        save_pending = False  # Once the save dialog is queued, it re-enables the button when done
         try:
             # Validate carrier and data file paths
             if not self.carrier_image_path or not self.data_file_path:
                 messagebox.showerror("Embeding Error", "Missing carrier image or data files.")
-                self.root.after(0, lambda: self.update_progress(0))
+                self._post_progress(0)
                 self.set_button_state(self.embed_button, "normal", operation=True)
                 return
 
             # Verify carrier image hash
-            with open(self.carrier_image_path, "rb") as f:
-                current_hash = hashlib.sha256(f.read()).hexdigest()
-            if self.carrier_image_hash != current_hash:
+            if not self._verify_unmodified(self.carrier_image_path, self.carrier_image_hash):
                 messagebox.showerror("Embeding Error", "Carrier Image has been Modified since Loading!")
-                self.root.after(0, lambda: self.update_progress(0))
+                self._post_progress(0)
                 self.set_button_state(self.embed_button, "normal", operation=True)
                 return
 
-            # Get encryption key
-            key_str = self.key_entry.get().strip()
             if not key_str:
                 messagebox.showerror("Embeding Error", "Please Provide a valid encryption key.")
-                self.root.after(0, lambda: self.update_progress(0))
+                self._post_progress(0)
                 self.set_button_state(self.embed_button, "normal", operation=True)
                 return
 
             # Initialize cipher with the key
             if not self.image_logic.get_cipher(key_str, self.root):
-                self.root.after(0, lambda: self.update_progress(0))
+                self._post_progress(0)
                 self.set_button_state(self.embed_button, "normal", operation=True)
                 return
 
@@ -960,7 +1166,7 @@ class SteganographyApp:
                 key_str,
                 password,
                 author,
-                lambda value: self.root.after(0, lambda v=value: self.update_progress(v))
+                self._throttled_progress(self._post_progress)
             )
 
             # Prompt user to save the embedded image
@@ -972,37 +1178,51 @@ class SteganographyApp:
                 )
                 
                 if save_path:
-                    # Save the embedded image
-                    self.stego_image.save(save_path)
-                    self.update_progress(100)
-                    messagebox.showinfo("Embedding Success", "Data embedded successfully!")
-                    self.history_manager.add_entry(
-                        "Embed",
-                        f"Embedded {len(self.data_file_path)} files into {save_path} (Image-Stego)"
-                    )
-                    self.update_history_view()
-                    self.root.after(100, self.reset_fields)
+                    def on_saved(future):
+                        # The write is over, so another embed may start now
+                        self._save_future = None
+                        self.set_button_state(self.embed_button, "normal", operation=True)
+                        if future.exception() is not None:
+                            logging.error(f"Saving stego image failed: {str(future.exception())}")
+                            messagebox.showerror("Embeding Failed", str(future.exception()))
+                            self.update_progress(0)
+                            return
+                        self.update_progress(100)
+                        messagebox.showinfo("Embedding Success", "Data embedded successfully!")
+                        self.history_manager.add_entry(
+                            "Embed",
+                            f"Embedded {len(self.data_file_path)} files into {save_path} (Image-Stego)"
+                        )
+                        self.update_history_view()
+                        self.root.after(100, self.reset_fields)
+
+                    # Encode on the I/O pool so the Tk thread stays responsive; zlib releases the GIL
+                    self._save_future = self._io_pool.submit(self.image_logic.save_png, self.stego_image, save_path)
+                    self._save_future.add_done_callback(lambda f: self._post_from_pool(on_saved, f))
                 else:
                     # User canceled saving
                     messagebox.showinfo("Embedding Cancelled", "Embedding operation cancelled by user.")
                     # Clear embedded data from memory but keep settings
                     self.stego_image = None
                     # Reset progress bar only
-                    self.root.after(0, lambda: self.update_progress(0))
+                    self._post_progress(0)
                     # Force garbage collection to free memory
                     import gc
                     gc.collect()
+                    self.set_button_state(self.embed_button, "normal", operation=True)
             
             # Schedule save dialog on the main thread
+            save_pending = True
             self.root.after(0, save_stego_image)
 
         except Exception as e:
             logging.error(f"Embedding failed: {str(e)}")
-            self.root.after(0, lambda: messagebox.showerror("Embeding Failed" , str(e)))
-            self.root.after(0, lambda: self.update_progress(0))
+            self._on_ui(messagebox.showerror, "Embeding Failed" , str(e))
+            self._post_progress(0)
             self.root.after(0, self.reset_fields)
         finally:
-            self.set_button_state(self.embed_button, "normal", operation=True)
+            if not save_pending:
+                self.set_button_state(self.embed_button, "normal", operation=True)
 
     def start_extract(self):
         """Start the image extraction process."""
@@ -1030,35 +1250,32 @@ class SteganographyApp:
         valid, password, author = self.validate_inputs(self.password_entry, self.author_entry, for_embedding=False)
         if not valid:
             return
-        threading.Thread(target=lambda: self._extract_data_thread(password), daemon=True).start()
+        self._work_q.put((self._extract_data_thread, (password, key_str)))
 
-    def _extract_data_thread(self, password):
+    def _extract_data_thread(self, password, key_str):
         """Extract data from the carrier image in a separate thread."""
         try:
             self.set_button_state(self.extract_button, "disabled", operation=True)
             if not self.carrier_image_path:
                 messagebox.showerror("Carrier Fail", "Select a carrier image.")
-                self.root.after(0, lambda: self.update_progress(0))  
+                self._post_progress(0)  
                 self.set_button_state(self.extract_button, "normal", operation=True)
                 return
 
-            with open(self.carrier_image_path, "rb") as f:
-                current_hash = hashlib.sha256(f.read()).hexdigest()
-            if self.carrier_image_hash != current_hash:
+            if not self._verify_unmodified(self.carrier_image_path, self.carrier_image_hash):
                 messagebox.showerror("Carrier Fail", "Carrier image has been modified since loading!")
-                self.root.after(0, lambda: self.update_progress(0))  
+                self._post_progress(0)  
                 self.set_button_state(self.extract_button, "normal", operation=True)
                 return
 
-            key_str = self.key_entry.get().strip()
             if not key_str:
                 messagebox.showerror("Extraction Error", "Please provide a valid encryption key.")
-                self.root.after(0, lambda: self.update_progress(0)) 
+                self._post_progress(0) 
                 self.set_button_state(self.extract_button, "normal", operation=True)
                 return
 
             if not self.image_logic.get_cipher(key_str, self.root):
-                self.root.after(0, lambda: self.update_progress(0))  
+                self._post_progress(0)  
                 self.set_button_state(self.extract_button, "normal", operation=True)
                 return
 
@@ -1070,14 +1287,14 @@ class SteganographyApp:
                 self.carrier_image_path,
                 key_str,
                 password,
-                lambda value: self.root.after(0, lambda v=value: self.update_progress(v)),
+                self._throttled_progress(self._post_progress),
                 carrier_filename=self.carrier_image_path
             )
 
             output_folder = filedialog.askdirectory(title="Select Output Folder")
             if not output_folder:
-                self.root.after(0, lambda: messagebox.showinfo("Extraction Canceled", "Extraction cancelled by user."))
-                self.root.after(0, lambda: self.update_progress(0))
+                self._on_ui(messagebox.showinfo, "Extraction Canceled", "Extraction cancelled by user.")
+                self._post_progress(0)
                 self.root.after(0, self.reset_fields)  # Reset immediately when cancelled
                 self.set_button_state(self.extract_button, "normal", operation=True)
                 return
@@ -1088,30 +1305,26 @@ class SteganographyApp:
             output_subfolder = os.path.join(output_folder, subfolder_name)
             os.makedirs(output_subfolder, exist_ok=True)
 
-            for i, (new_filename, ext, file_data) in enumerate(files_data):
-                output_filename = f"{new_filename}{ext}"
-                output_path = os.path.join(output_subfolder, output_filename)
-                with open(output_path, "wb") as output_file:
-                    output_file.write(file_data)
-                self.root.after(0, lambda v=75 + (25 * (i + 1) // len(files_data)): self.update_progress(v))
+            outputs = [(f"{new_filename}{ext}", file_data) for new_filename, ext, file_data in files_data]
+            self._write_extracted_files(output_subfolder, outputs, self._post_progress)
 
-            self.root.after(0, lambda: self.update_progress(100))
-            self.root.after(0, lambda: messagebox.showinfo(
+            self._post_progress(100)
+            self._on_ui(messagebox.showinfo,
                 "Extraction Success",
                 f"Extracted {len(files_data)} files to {output_subfolder}\n\n"
                 f"Metadata:\nAuthor: {author}\nTimestamp: {timestamp_readable}"
-            ))
+            )
             self.history_manager.add_entry(
                 "Extract",
                 f"Extracted {len(files_data)} files from {self.carrier_image_path} to {output_subfolder} (Image-Stego)"
             )
-            self.update_history_view()
+            self.root.after(0, self.update_history_view)
             self.root.after(0, self.reset_fields)  # Reset immediately after success
 
         except Exception as e:
             logging.error(f"Extraction failed: {str(e)}")
-            self.root.after(0, lambda: messagebox.showerror("Extraction Error" ,  str(e)))
-            self.root.after(0, lambda: self.update_progress(0))
+            self._on_ui(messagebox.showerror, "Extraction Error" ,  str(e))
+            self._post_progress(0)
             self.root.after(0, self.reset_fields)  # Reset immediately on error
         finally:
             self.set_button_state(self.extract_button, "normal", operation=True)
@@ -1121,7 +1334,7 @@ class SteganographyApp:
         if self.operation_in_progress:
             return
 
-        threading.Thread(target=self._view_metadata_thread, daemon=True).start()
+        self._work_q.put((self._view_metadata_thread, ()))
 
     def _view_metadata_thread(self):
         """View metadata from a stego image in a separate thread."""
@@ -1133,13 +1346,13 @@ class SteganographyApp:
             return
         
         try:
-            self.update_progress(10)
+            self._post_progress(10)
             
             # First check if this is a steganography image
             is_stego = self.detect_image_steganography(self.carrier_image_path)
             if not is_stego:
                 messagebox.showinfo("Information", "This is Not a Steganography Image.")
-                self.update_progress(0)
+                self._post_progress(0)
                 self.set_button_state(self.metadata_button, "normal", operation=True)
                 return
             else:
@@ -1149,7 +1362,7 @@ class SteganographyApp:
             key_str = self.key_entry.get().strip()
             if not key_str:
                 messagebox.showerror("Extraction Error", "Please Provide an Encryption Key.")
-                self.update_progress(0)
+                self._post_progress(0)
                 self.set_button_state(self.metadata_button, "normal", operation=True)
                 return
                 
@@ -1157,19 +1370,19 @@ class SteganographyApp:
             password = self.password_entry.get().strip()
             if not password:
                 messagebox.showerror("Extraction Error", "Please Enter The Password Used During Embedding.")
-                self.update_progress(0)
+                self._post_progress(0)
                 self.set_button_state(self.metadata_button, "normal", operation=True)
                 return
             
-            self.update_progress(20)
+            self._post_progress(20)
             
             # Initialize cipher with the key
             if not self.image_logic.get_cipher(key_str, self.root):
-                self.update_progress(0)
+                self._post_progress(0)
                 self.set_button_state(self.metadata_button, "normal", operation=True)
                 return
                 
-            self.update_progress(30)
+            self._post_progress(30)
             
             # Try to extract metadata
             try:
@@ -1178,11 +1391,11 @@ class SteganographyApp:
                     self.carrier_image_path,
                     key_str,
                     password,
-                    lambda value: self.root.after(0, lambda v=value: self.update_progress(v)),
+                    self._throttled_progress(self._post_progress),
                     carrier_filename=self.carrier_image_path
                 )
                 
-                self.update_progress(100)
+                self._post_progress(100)
                 
                 # Display the metadata
                 messagebox.showinfo(
@@ -1197,7 +1410,7 @@ class SteganographyApp:
                     "View Metadata",
                     f"Viewed metadata from {self.carrier_image_path} (Image-Stego)"
                 )
-                self.update_history_view()
+                self.root.after(0, self.update_history_view)
                 
             except ValueError as extract_error:
                 error_str = str(extract_error).lower()
@@ -1215,7 +1428,7 @@ class SteganographyApp:
             messagebox.showerror("Extraction Error", "Failed to view Image Metadata")
             
         finally:
-            self.update_progress(0)
+            self._post_progress(0)
             self.set_button_state(self.metadata_button, "normal", operation=True)
 
     def detect_image_steganography(self, image_path):
@@ -1226,50 +1439,24 @@ class SteganographyApp:
             
             # Attempt to open and process the image
             try:
-                print("[StegoDetector] Loading and converting image to RGB...")
-                carrier_image = Image.open(image_path).convert('RGB')
-                print("[StegoDetector] Converting image to numpy array...")
-                image_array = np.array(carrier_image, dtype=np.uint8)
-                print("[StegoDetector] Flattening image array...")
-                flat_image = image_array.flatten()
+                print("[StegoDetector] Loading image pixels...")
+                # Detection only reads the pixels, so view the decoded buffer instead of copying it twice
+                with Image.open(image_path) as carrier_image:
+                    if carrier_image.mode != 'RGB':
+                        carrier_image = carrier_image.convert('RGB')
+                    flat_image = np.frombuffer(carrier_image.tobytes(), dtype=np.uint8)
                 print(f"[StegoDetector] Image array flattened, size: {len(flat_image)} pixels")
             except Exception as e:
                 print(f"[StegoDetector] Error processing image: {str(e)}")
                 return False, f"Error processing image: {str(e)}"
 
-            # Extract bits from LSBs
+            # Read the LSBs up to the termination sequence with the vectorized extractor
             print("[StegoDetector] Extracting bits from LSBs...")
-            bits = []
-            i = 0
-            found_termination = False
-            while i < len(flat_image):
-                bit = flat_image[i] & 1
-                bits.append(str(bit))
-                i += 1
-                if i % 1000000 == 0:
-                    print(f"[StegoDetector] Processed {i} pixels...")
-                if i >= 16 and ''.join(bits[-16:]) == '1111111111111110':
-                    print("[StegoDetector] Termination sequence '1111111111111110' found!")
-                    found_termination = True
-                    break
-
-            if not found_termination:
+            full_data = self.image_logic.read_lsb_payload(flat_image)
+            if full_data is None:
                 print("[StegoDetector] Reached end of image without finding termination sequence.")
                 return False, "No steganography detected: No termination sequence found."
-
-            print(f"[StegoDetector] Extracted {i} bits before termination sequence.")
-
-            # Convert bits to bytes
-            print("[StegoDetector] Converting bits to bytes...")
-            data_bits = bits[:-16]
-            print(f"[StegoDetector] Total data bits (excluding termination): {len(data_bits)}")
-            byte_array = bytearray()
-            for j in range(0, len(data_bits), 8):
-                if j + 8 <= len(data_bits):
-                    byte = ''.join(data_bits[j:j+8])
-                    byte_array.append(int(byte, 2))
-            full_data = bytes(byte_array)
-            print(f"[StegoDetector] Converted to {len(full_data)} bytes of data.")
+            print(f"[StegoDetector] Extracted {len(full_data)} bytes of data before termination sequence.")
 
             # Check for data length
             print("[StegoDetector] Checking data length prefix...")
@@ -1277,7 +1464,7 @@ class SteganographyApp:
                 print("[StegoDetector] Data length prefix missing or invalid.")
                 return False, "No steganography detected: Invalid data length."
 
-            data_length = struct.unpack(">I", full_data[:4])[0]
+            data_length = int.from_bytes(full_data[:4], "big")
             print(f"[StegoDetector] Data length from prefix: {data_length} bytes")
             
             # Use a reasonable size limit directly
@@ -1320,7 +1507,7 @@ class SteganographyApp:
             
         except Exception as e:
             logging.error("Failed to load carrier GIF")
-            self.root.after(0, lambda: messagebox.showerror("Carrier Fail", "Failed to Load GIF"))
+            self._on_ui(messagebox.showerror, "Carrier Fail", "Failed to Load GIF")
             # Reset all fields regardless of whether there was a previous GIF
             self.root.after(0, self.reset_gif_fields)
         finally:
@@ -1330,15 +1517,8 @@ class SteganographyApp:
         """Load the carrier GIF and compute its hash."""
         with self.gif_load_lock:
             try:
-                with open(self.carrier_gif_path, "rb") as f:
-                    self.carrier_gif_hash = hashlib.sha256(f.read()).hexdigest()
-                
-                # Update status and enable buttons
+                self.carrier_gif_hash = self._carrier_hash(self.carrier_gif_path)
                 gif_filename = os.path.basename(self.carrier_gif_path)
-                self.root.after(0, lambda: self.carrier_gif_status.configure(
-                    text=f"GIF selected ({gif_filename})", 
-                    text_color="green"
-                ))
                 
                 # Check if this is a steganography GIF (without showing UI notifications)
                 is_stego, _ = self.detect_gif_steganography(self.carrier_gif_path)
@@ -1347,40 +1527,36 @@ class SteganographyApp:
                 else:
                     print("[STEGO DETECTION] This is not a stego GIF.")
                 
-                # Enable buttons when GIF is loaded successfully
-                self.root.after(0, lambda: self.gif_embed_button.configure(state="normal"))
-                self.root.after(0, lambda: self.gif_extract_button.configure(state="normal"))
-                self.root.after(0, lambda: self.gif_metadata_button.configure(state="normal"))
-                self.root.after(0, lambda: self.gif_generate_key_button.configure(state="normal"))
-                
-                # Enable input fields with updated placeholders
-                self.root.after(0, lambda: self.gif_key_entry.configure(
-                    state="normal", 
-                    placeholder_text="Enter or generate a key" , 
-                    show="*"
-                ))
-                self.root.after(0, lambda: self.gif_password_entry.configure(
-                    state="normal", 
-                    placeholder_text="Enter password " , 
-                    show="*"
-                ))
-                self.root.after(0, lambda: self.gif_author_entry.configure(
-                    state="normal", 
-                    placeholder_text="Enter author name (optional)"
-                ))
+                # Apply every widget update in one callback
+                self._post_from_pool(self._finalize_gif_load_ok, gif_filename)
                 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Carrier Fail", "Failed to Load GIF"))
-                self.root.after(0, lambda: self.carrier_gif_status.configure(
-                    text="Failed to Load GIF", 
-                    text_color="red"
-                ))
-                
-                # Reset all fields to initial state instead of just disabling buttons
-                self.root.after(0, self.reset_gif_fields)
-                
-            finally:
-                self.root.after(0, lambda: self.load_gif_button.configure(state="normal"))
+                self._post_from_pool(self._finalize_gif_load_failed)
+
+    def _finalize_gif_load_ok(self, gif_filename):
+        """Apply all UI updates for a successfully loaded carrier GIF."""
+        self.carrier_gif_status.configure(text=f"GIF selected ({gif_filename})", text_color="green")
+        
+        # Enable buttons when GIF is loaded successfully
+        self.gif_embed_button.configure(state="normal")
+        self.gif_extract_button.configure(state="normal")
+        self.gif_metadata_button.configure(state="normal")
+        self.gif_generate_key_button.configure(state="normal")
+        
+        # Enable input fields with updated placeholders
+        self.gif_key_entry.configure(state="normal", placeholder_text="Enter or generate a key" , show="*")
+        self.gif_password_entry.configure(state="normal", placeholder_text="Enter password " , show="*")
+        self.gif_author_entry.configure(state="normal", placeholder_text="Enter author name (optional)")
+        self.load_gif_button.configure(state="normal")
+
+    def _finalize_gif_load_failed(self):
+        """Apply all UI updates for a carrier GIF that failed to load."""
+        messagebox.showerror("Carrier Fail", "Failed to Load GIF")
+        self.carrier_gif_status.configure(text="Failed to Load GIF", text_color="red")
+        
+        # Reset all fields to initial state instead of just disabling buttons
+        self.reset_gif_fields()
+        self.load_gif_button.configure(state="normal")
 
     def drop_carrier_gif(self, event):
         """Handle dropped files for carrier GIF."""
@@ -1394,7 +1570,7 @@ class SteganographyApp:
             return
 
         file_path = files[0]
-        if not file_path.lower().endswith('.gif'):
+        if not self._GIF_RE.search(file_path):
             messagebox.showerror("Carrier Fail", "Please Drop a GIF File.")
             return
         
@@ -1409,7 +1585,7 @@ class SteganographyApp:
         self.carrier_gif_path = file_path
         self.carrier_gif_status.configure(text="Loading...", text_color="yellow")
         self.load_gif_button.configure(state="disabled")
-        threading.Thread(target=self._load_carrier_gif, daemon=True).start()
+        self._io_pool.submit(self._load_carrier_gif)
 
     def load_carrier_gif(self, file_path=None):
         """Load the carrier GIF and compute its hash for integrity."""
@@ -1434,37 +1610,13 @@ class SteganographyApp:
 
         self.carrier_gif_status.configure(text="Loading...", text_color="yellow")
         self.load_gif_button.configure(state="disabled")
-        threading.Thread(target=self._load_carrier_gif, daemon=True).start()
+        self._io_pool.submit(self._load_carrier_gif)
 
     def drop_gif_data_file(self, event):
         """Handle dropped files for data to hide in GIF-Stego."""
-        MAX_FILES = 20
-        MAX_FILE_SIZE = 500 * 1024 * 1024  # 500 MB per file for GIFs
-        MAX_TOTAL_SIZE = 500 * 1024 * 1024  # 500 MB total
-
         files = self.root.splitlist(event.data)
-        if len(files) > MAX_FILES:
-            messagebox.showerror("Data Fail", f"You Can Only Select Up to {MAX_FILES} Files at a Time.")
-            return
-
-        # Check file sizes
-        total_size = 0
-        oversized_files = []
-        for path in files:
-            file_size = os.path.getsize(path)
-            if file_size > MAX_FILE_SIZE:
-                oversized_files.append(f"'{os.path.basename(path)}' ({file_size / (1024*1024):.1f} MB)")
-            total_size += file_size
-            if total_size > MAX_TOTAL_SIZE:
-                messagebox.showerror("Data Fail", 
-                    f"Total size of Dropped Files ({total_size / (1024*1024):.1f} MB) "
-                    f"Exceeds the Maximum Limit of {MAX_TOTAL_SIZE / (1024*1024):.1f} MB")
-                return
-
-        if oversized_files:
-            messagebox.showerror("Data Fail",
-                f"The Following Files Exceed the {MAX_FILE_SIZE / (1024*1024):.1f} MB Per-File Limit:\n\n" +
-                "\n".join(oversized_files))
+        total_size = self._validate_data_files(files, self.MAX_GIF_DATA_FILE_SIZE, "Dropped")
+        if total_size is None:
             return
 
         self.gif_data_file_path = files
@@ -1476,41 +1628,13 @@ class SteganographyApp:
 
     def load_gif_data_file(self, file_paths=None):
         """Load data files to embed for GIF stego."""
-        MAX_FILE_SIZE = 500 * 1024 * 1024  # 500 MB per file for GIFs
-        MAX_TOTAL_SIZE = 500 * 1024 * 1024  # 500 MB total
-        MAX_FILES = 20
-
         if not file_paths:
             self.gif_data_file_path = filedialog.askopenfilenames(filetypes=[("All files", "*.*")])
         else:
             self.gif_data_file_path = file_paths
 
-        if len(self.gif_data_file_path) > MAX_FILES:
-            messagebox.showerror("Data Fail", f"You Can Only Select Up to {MAX_FILES} Files at a Time.")
-            self.gif_data_file_path = []
-            self.gif_data_file_status.configure(text="No Files Selected", text_color="red")
-            return
-
-        # Check file sizes
-        total_size = 0
-        oversized_files = []
-        for path in self.gif_data_file_path:
-            file_size = os.path.getsize(path)
-            if file_size > MAX_FILE_SIZE:
-                oversized_files.append(f"'{os.path.basename(path)}' ({file_size / (1024*1024):.1f} MB)")
-            total_size += file_size
-            if total_size > MAX_TOTAL_SIZE:
-                messagebox.showerror("Data Fail", 
-                    f"Total size of Selected Files ({total_size / (1024*1024):.1f} MB) "
-                    f"Exceeds the Maximum Limit of {MAX_TOTAL_SIZE / (1024*1024):.1f} MB")
-                self.gif_data_file_path = []
-                self.gif_data_file_status.configure(text="No Files Selected", text_color="red")
-                return
-
-        if oversized_files:
-            messagebox.showerror("Data Fail",
-                f"The Following Files Exceed the {MAX_FILE_SIZE / (1024*1024):.1f} MB Per-File Limit:\n\n" +
-                "\n".join(oversized_files))
+        total_size = self._validate_data_files(self.gif_data_file_path, self.MAX_GIF_DATA_FILE_SIZE, "Selected")
+        if total_size is None:
             self.gif_data_file_path = []
             self.gif_data_file_status.configure(text="No Files Selected", text_color="red")
             return
@@ -1551,38 +1675,34 @@ class SteganographyApp:
         valid, gif_password, author = self.validate_inputs(self.gif_password_entry, self.gif_author_entry)
         if not valid:
             return
-        threading.Thread(target=lambda: self._gif_embed_data_thread(gif_password, author), daemon=True).start()
+        self._work_q.put((self._gif_embed_data_thread, (gif_password, author, key_str)))
 
-    def _gif_embed_data_thread(self, password, author):
+    def _gif_embed_data_thread(self, password, author, key_str):
         """Embed data into the carrier GIF in a separate thread."""
         self.set_button_state(self.gif_embed_button, "disabled", operation=True)
         try:
             # Validate carrier and data file paths
             if not self.carrier_gif_path or not self.gif_data_file_path:
                 messagebox.showerror("Carrier Fail", "Missing carrier GIF or data files.")
-                self.root.after(0, lambda: self.update_gif_progress(0))
+                self._post_gif_progress(0)
                 self.set_button_state(self.gif_embed_button, "normal", operation=True)
                 return
 
             # Verify carrier GIF hash
-            with open(self.carrier_gif_path, "rb") as f:
-                current_hash = hashlib.sha256(f.read()).hexdigest()
-            if self.carrier_gif_hash != current_hash:
+            if not self._verify_unmodified(self.carrier_gif_path, self.carrier_gif_hash):
                 messagebox.showerror("Carrier Fail", "Carrier GIF has been Modified Since Loading!")
-                self.root.after(0, lambda: self.update_gif_progress(0))
+                self._post_gif_progress(0)
                 self.set_button_state(self.gif_embed_button, "normal", operation=True)
                 return
 
-            # Get encryption key
-            key_str = self.gif_key_entry.get().strip()
             if not key_str:
                 messagebox.showerror("Embeding Error", "Please Provide a Valid Encryption Key.")
-                self.root.after(0, lambda: self.update_gif_progress(0))
+                self._post_gif_progress(0)
                 self.set_button_state(self.gif_embed_button, "normal", operation=True)
                 return
             # Initialize cipher with the key
             if not self.gif_logic.get_cipher(key_str, self.root, self.key_is_generated):
-                self.root.after(0, lambda: self.update_gif_progress(0))
+                self._post_gif_progress(0)
                 self.set_button_state(self.gif_embed_button, "normal", operation=True)
                 return
 
@@ -1598,7 +1718,7 @@ class SteganographyApp:
                 key_str,
                 password,
                 author,
-                lambda value: self.root.after(0, lambda v=value: self.update_gif_progress(v))
+                self._throttled_progress(self._post_gif_progress)
             )
 
             # Prompt user to save the embedded GIF - pass output_data as a parameter to avoid scope issues
@@ -1610,7 +1730,7 @@ class SteganographyApp:
                 )
                 if not save_path:
                     messagebox.showinfo("Embedding Canceled", "Embedding operation cancelled by user.")
-                    self.root.after(0, lambda: self.update_gif_progress(0))
+                    self._post_gif_progress(0)
                     import gc
                     gc.collect()
                     return
@@ -1651,7 +1771,7 @@ class SteganographyApp:
                     self.root.after(100, self.reset_gif_fields)
                 except Exception as e:
                     messagebox.showerror("Embedding Error", f"Failed to save stego GIF: {str(e)}")
-                    self.root.after(0, lambda: self.update_gif_progress(0))
+                    self._post_gif_progress(0)
                     import gc
                     gc.collect()
             
@@ -1661,7 +1781,7 @@ class SteganographyApp:
         except Exception as e:
             logging.error(f"Embedding failed: {str(e)}")
             messagebox.showerror("Embeding Error", str(e))
-            self.update_gif_progress(0)
+            self._post_gif_progress(0)
             self.root.after(0, self.reset_gif_fields)
         finally:
             self.set_button_state(self.gif_embed_button, "normal", operation=True)
@@ -1692,33 +1812,30 @@ class SteganographyApp:
         valid, password, author = self.validate_inputs(self.gif_password_entry, self.gif_author_entry, for_embedding=False)
         if not valid:
             return
-        threading.Thread(target=lambda: self._gif_extract_data_thread(password), daemon=True).start()
+        self._work_q.put((self._gif_extract_data_thread, (password, key_str)))
 
-    def _gif_extract_data_thread(self, password):
+    def _gif_extract_data_thread(self, password, key_str):
         self.set_button_state(self.gif_extract_button, "disabled", operation=True)
         if not self.carrier_gif_path:
             messagebox.showerror("Carrier Fail", "Select a carrier GIF.")
-            self.root.after(0, lambda: self.update_gif_progress(0))  
+            self._post_gif_progress(0)  
             self.set_button_state(self.gif_extract_button, "normal", operation=True)
             return
 
-        with open(self.carrier_gif_path, "rb") as f:
-            current_hash = hashlib.sha256(f.read()).hexdigest()
-        if self.carrier_gif_hash != current_hash:
+        if not self._verify_unmodified(self.carrier_gif_path, self.carrier_gif_hash):
             messagebox.showerror("Carrier Fail", "Carrier GIF has been modified since loading!")
-            self.root.after(0, lambda: self.update_gif_progress(0))  
+            self._post_gif_progress(0)  
             self.set_button_state(self.gif_extract_button, "normal", operation=True)
             return
 
-        key_str = self.gif_key_entry.get().strip()
         if not key_str:
             messagebox.showerror("Extraction Error", "Please Provide a Valid Encryption Key.")
-            self.root.after(0, lambda: self.update_gif_progress(0))  
+            self._post_gif_progress(0)  
             self.set_button_state(self.gif_extract_button, "normal", operation=True)
             return
 
         if not self.gif_logic.get_cipher(key_str, self.root, self.key_is_generated):
-            self.root.after(0, lambda: self.update_gif_progress(0))  
+            self._post_gif_progress(0)  
             self.set_button_state(self.gif_extract_button, "normal", operation=True)
             return
 
@@ -1729,13 +1846,13 @@ class SteganographyApp:
         try:
             files_data, author, timestamp = self.gif_logic.extract_data(
                 self.carrier_gif_path, key_str, password,
-                lambda value: self.root.after(0, lambda v=value: self.update_gif_progress(v))
+                self._throttled_progress(self._post_gif_progress)
             )
 
             output_folder = filedialog.askdirectory(title="Select Output Folder")
             if not output_folder:
-                self.root.after(0, lambda: messagebox.showinfo("Extraction Canceled", "Extraction cancelled by user."))
-                self.root.after(0, lambda: self.update_gif_progress(0))
+                self._on_ui(messagebox.showinfo, "Extraction Canceled", "Extraction cancelled by user.")
+                self._post_gif_progress(0)
                 self.root.after(0, self.reset_gif_fields)  # Reset immediately when cancelled
                 self.set_button_state(self.gif_extract_button, "normal", operation=True)
                 return
@@ -1746,31 +1863,29 @@ class SteganographyApp:
             output_subfolder = os.path.join(output_folder, subfolder_name)
             os.makedirs(output_subfolder, exist_ok=True)
 
-            for i, (filename, ext, file_data) in enumerate(files_data):
-                output_filename = f"{filename.strip()}{ext.strip()}"
-                output_filename = "".join(c for c in output_filename if c.isalnum() or c in ('.', '_', '-'))
-                output_path = os.path.join(output_subfolder, output_filename)
-                with open(output_path, "wb") as output_file:
-                    output_file.write(file_data)
-                self.root.after(0, lambda v=75 + (25 * (i + 1) // len(files_data)): self.update_gif_progress(v))
+            outputs = []
+            for filename, ext, file_data in files_data:
+                output_filename = self._UNSAFE_FILENAME_RE.sub('', f"{filename.strip()}{ext.strip()}")
+                outputs.append((output_filename, file_data))
+            self._write_extracted_files(output_subfolder, outputs, self._post_gif_progress)
 
-            self.root.after(0, lambda: self.update_gif_progress(100))
-            self.root.after(0, lambda: messagebox.showinfo(
+            self._post_gif_progress(100)
+            self._on_ui(messagebox.showinfo,
                 "Extraction Success",
                 f"Extracted {len(files_data)} files to {output_subfolder}\n\n"
                 f"Metadata:\nAuthor: {author}\nTimestamp: {timestamp}"
-            ))
+            )
             self.history_manager.add_entry(
                 "Extract",
                 f"Extracted {len(files_data)} files from {self.carrier_gif_path} to {output_subfolder} (GIF-Stego)"
             )
-            self.update_history_view()
+            self.root.after(0, self.update_history_view)
             self.root.after(0, self.reset_gif_fields)  # Reset immediately after success
 
         except Exception as e:
             logging.error(f"Extraction failed: {str(e)}")
-            self.root.after(0, lambda: messagebox.showerror("Extraction Error", str(e) ))
-            self.root.after(0, lambda: self.update_gif_progress(0))
+            self._on_ui(messagebox.showerror, "Extraction Error", str(e) )
+            self._post_gif_progress(0)
             self.root.after(0, self.reset_gif_fields)  # Reset immediately on error
         finally:
             self.set_button_state(self.gif_extract_button, "normal", operation=True)
@@ -1780,7 +1895,7 @@ class SteganographyApp:
         if self.operation_in_progress:
             return
 
-        threading.Thread(target=self._gif_view_metadata_thread, daemon=True).start()
+        self._work_q.put((self._gif_view_metadata_thread, ()))
 
     def _gif_view_metadata_thread(self):
         """View metadata from a stego GIF in a separate thread."""
@@ -1792,13 +1907,13 @@ class SteganographyApp:
             return
         
         try:
-            self.update_gif_progress(10)
+            self._post_gif_progress(10)
             
             # First check if this is a steganography GIF
             is_stego = self.detect_gif_steganography(self.carrier_gif_path)
             if not is_stego:
                 messagebox.showinfo("Information", "This is not a stego GIF.")
-                self.update_gif_progress(0)
+                self._post_gif_progress(0)
                 self.set_button_state(self.gif_metadata_button, "normal", operation=True)
                 return
             else:
@@ -1808,7 +1923,7 @@ class SteganographyApp:
             key_str = self.gif_key_entry.get().strip()
             if not key_str:
                 messagebox.showerror("Extraction Error", "Please Provide an Encryption Key.")
-                self.update_gif_progress(0)
+                self._post_gif_progress(0)
                 self.set_button_state(self.gif_metadata_button, "normal", operation=True)
                 return
                 
@@ -1816,19 +1931,19 @@ class SteganographyApp:
             gif_password = self.gif_password_entry.get().strip()
             if not gif_password:
                 messagebox.showerror("Extraction Error", "Please Provide a Password.")
-                self.update_gif_progress(0)
+                self._post_gif_progress(0)
                 self.set_button_state(self.gif_metadata_button, "normal", operation=True)
                 return
             
-            self.update_gif_progress(20)
+            self._post_gif_progress(20)
             
             # Initialize cipher with the key
             if not self.gif_logic.get_cipher(key_str, self.root, self.key_is_generated):
-                self.update_gif_progress(0)
+                self._post_gif_progress(0)
                 self.set_button_state(self.gif_metadata_button, "normal", operation=True)
                 return
                 
-            self.update_gif_progress(30)
+            self._post_gif_progress(30)
             
             # Try to extract metadata
             try:
@@ -1837,10 +1952,10 @@ class SteganographyApp:
                     self.carrier_gif_path,
                     key_str,
                     gif_password,
-                    lambda value: self.root.after(0, lambda v=value: self.update_gif_progress(v))
+                    self._throttled_progress(self._post_gif_progress)
                 )
                 
-                self.update_gif_progress(100)
+                self._post_gif_progress(100)
                 
                 # Display the metadata
                 messagebox.showinfo(
@@ -1855,7 +1970,7 @@ class SteganographyApp:
                     "View Metadata",
                     f"Viewed metadata from {self.carrier_gif_path} (GIF-Stego)"
                 )
-                self.update_history_view()
+                self.root.after(0, self.update_history_view)
                 
             except ValueError as extract_error:
                 error_str = str(extract_error).lower()
@@ -1873,7 +1988,7 @@ class SteganographyApp:
             messagebox.showerror("Extraction Error", str(e))
             
         finally:
-            self.update_gif_progress(0)
+            self._post_gif_progress(0)
             self.set_button_state(self.gif_metadata_button, "normal", operation=True)
 
     def detect_gif_steganography(self, gif_path):
@@ -1907,7 +2022,7 @@ class SteganographyApp:
                 return False, "No steganography detected: Insufficient data after GIF trailer"               
             # Extract length prefix
             try:
-                data_length = struct.unpack(">I", remaining_data[:4])[0]
+                data_length = int.from_bytes(remaining_data[:4], "big")
                 # Check if length is reasonable
                 if data_length <= 0 or data_length > 1024 * 1024 * 100:  # 100MB max
                     return False, f"No steganography detected: Invalid data length ({data_length})"
@@ -1935,35 +2050,27 @@ class SteganographyApp:
         try:
             # Check if the file exists
             if not os.path.exists(gif_path):
-                self.root.after(0, lambda: messagebox.showerror("Carrier fail", "GIF file does not exist."))
+                self._on_ui(messagebox.showerror, "Carrier fail", "GIF file does not exist.")
                 self.root.after(0, self.reset_gif_fields)  # Reset all fields if invalid
                 return False
                 
             # Check file extension
-            if not gif_path.lower().endswith('.gif'):
-                self.root.after(0, lambda: messagebox.showerror("Carrier Fail", "Not a GIF file. Please Select a File with .gif Extension."))
+            if not self._GIF_RE.search(gif_path):
+                self._on_ui(messagebox.showerror, "Carrier Fail", "Not a GIF file. Please Select a File with .gif Extension.")
                 self.root.after(0, self.reset_gif_fields)  # Reset all fields if invalid
                 return False
                 
-            # Try to open with PIL
-            try:
-                Image.open(gif_path).verify()
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Carrier Fail", f"Invalid GIF Format"))
-                self.root.after(0, self.reset_gif_fields)  # Reset all fields if invalid
-                return False
-                
-            # Check if the file starts with the GIF signature
+            # Check the 6-byte GIF signature; the full decode is left to the embed/extract pipeline
             with open(gif_path, 'rb') as f:
                 header = f.read(6)
-                if not header.startswith(b'GIF8'):
-                    self.root.after(0, lambda: messagebox.showerror("Carrier Fail", "Not a Valid GIF File (Invalid Header)."))
+                if header not in (b'GIF87a', b'GIF89a'):
+                    self._on_ui(messagebox.showerror, "Carrier Fail", "Not a Valid GIF File (Invalid Header).")
                     self.root.after(0, self.reset_gif_fields)  # Reset all fields if invalid
                     return False
                     
             return True
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Carrier Fail", "Failed to Validate GIF"))
+            self._on_ui(messagebox.showerror, "Carrier Fail", "Failed to Validate GIF")
             self.root.after(0, self.reset_gif_fields)  # Reset all fields if invalid
             return False
     
@@ -1988,16 +2095,30 @@ class SteganographyApp:
             return False, None, None
 
     def update_history_view(self):
-        """Update the history view with the latest entries."""
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-        for entry in self.history_manager.get_history():
-            self.history_tree.insert("", "end", values=(
-                entry["timestamp"], entry["operation"], entry["details"]
-            ))
+        """Update the history view with the latest entries; workers must post this to the Tk thread."""
+        # Nothing to refresh until the History page has been built
+        if "history" not in self.frames:
+            return
+        # History is append-only, so only rows added since the last refresh need inserting
+        rows = list(self.history_manager.get_history(self._history_inserted))
+        self._history_inserted += len(rows)
+        if len(rows) > 1:
+            # Unmap the tree while filling it so Tk lays it out once instead of per row
+            self.history_tree.pack_forget()
+            for row in rows:
+                self.history_tree.insert("", "end", values=row)
+            self.history_tree.pack(side="left", fill="both", expand=True)
+        elif rows:
+            self.history_tree.insert("", "end", values=rows[0])
 
     def update_progress(self, value):
         """Update the progress bar value and label."""
+        pct = int(value)
+        now = time.monotonic()
+        # Skip repeats of the percentage already on screen (~30 fps cap)
+        if pct == self._last_progress and now - self._last_progress_t < 0.033:
+            return
+        self._last_progress, self._last_progress_t = pct, now
         self.progress.set(value / 100)  # CustomTkinter progress bars use 0-1 range
         self.progress_label.configure(text=f"Progress: {value}%")
         # Force update to ensure progress is displayed immediately
@@ -2005,6 +2126,12 @@ class SteganographyApp:
 
     def update_gif_progress(self, value):
         """Update the GIF progress bar value and label."""
+        pct = int(value)
+        now = time.monotonic()
+        # Skip repeats of the percentage already on screen (~30 fps cap)
+        if pct == self._last_gif_progress and now - self._last_gif_progress_t < 0.033:
+            return
+        self._last_gif_progress, self._last_gif_progress_t = pct, now
         self.gif_progress.set(value / 100)
         self.gif_progress_label.configure(text=f"Progress: {value}%")
         # Force update to ensure progress is displayed immediately
@@ -2030,7 +2157,8 @@ class SteganographyApp:
         self.carrier_image_status.configure(text="No Image Selected", text_color="red")
         self.data_file_status.configure(text="No Files Selected", text_color="red")
         
-        # Hide the entropy label if it exists
+        # Hide the entropy label if it exists, and drop any scan still running for the old carrier
+        self._entropy_generation += 1
         if hasattr(self, 'entropy_label'):
             self.entropy_label.pack_forget()
         
@@ -2175,6 +2303,34 @@ class SteganographyApp:
         # Final UI update
         self.root.update_idletasks()
 
+    def _post_progress(self, value):
+        """Schedule an image progress bar update on the Tk thread."""
+        self.root.after(0, self.update_progress, value)
+
+    def _post_gif_progress(self, value):
+        """Schedule a GIF progress bar update on the Tk thread."""
+        self.root.after(0, self.update_gif_progress, value)
+
+    def _throttled_progress(self, post):
+        """Wrap a progress poster so worker callbacks reach Tk at most ~30 times a second."""
+        last = [-1, 0.0]  # Last posted value and when it was posted
+        def throttled(value):
+            now = time.monotonic()
+            if value == last[0] or (now - last[1] < 0.033 and value < 100):
+                return
+            last[0], last[1] = value, now
+            post(value)
+        return throttled
+
+    def _write_extracted_files(self, output_subfolder, outputs, post_progress):
+        """Write extracted (filename, data) pairs concurrently, advancing progress from 75% to 100%."""
+        # Disk writes release the GIL, so a few threads let them overlap
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, max(1, len(outputs)))) as pool:
+            futures = [pool.submit(_write_file, os.path.join(output_subfolder, name), data) for name, data in outputs]
+            for i, future in enumerate(concurrent.futures.as_completed(futures)):
+                future.result()
+                post_progress(75 + (25 * (i + 1) // len(outputs)))
+
     def set_button_state(self, button, state, operation=False):
         """Set button state and update operation in progress flag."""
         button.configure(state=state)
@@ -2188,8 +2344,18 @@ class SteganographyApp:
         self.carrier_gif_path = None
         self.data_file_path = None
         self.gif_data_file_path = None
-        self.stego_image = None
-        gc.collect()
+        self.history_manager.flush()
+        # Never block the Tk thread here: pool jobs end by posting to Tk, so waiting on them would hang.
+        # Queued loads are dropped; a running save finishes before the interpreter exits
+        self._closing = True
+        if sys.version_info >= (3, 9):
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._io_pool.shutdown(wait=False)  # cancel_futures is 3.9+; queued loads then run out at exit
+        if self._save_future is None or self._save_future.done():
+            if self.stego_image is not None:
+                self.stego_image.close()
+            self.stego_image = None
 
     def on_gif_key_entry(self, event):
         self.key_is_generated = False  # Mark as manual entry
@@ -2209,8 +2375,9 @@ if __name__ == "__main__":
             # Disable drag-and-drop functionality
             app.image_section.drop_target_register()  # Unregister DND
             app.data_section.drop_target_register()
-            app.gif_section.drop_target_register()
-            app.gif_data_section.drop_target_register()
+            if hasattr(app, "gif_section"):
+                app.gif_section.drop_target_register()
+                app.gif_data_section.drop_target_register()
         else:
             raise e
     root.protocol("WM_DELETE_WINDOW", lambda: [app.cleanup(), root.destroy()])
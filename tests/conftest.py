@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The app modules live at the repository root rather than in an installed package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# flanchy_test.py is a manual script that runs on import, not a pytest module
+collect_ignore = ["flanchy_test.py"]
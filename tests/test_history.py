@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+pytest.importorskip("customtkinter")
+pytest.importorskip("tkinterdnd2")
+from main import HistoryManager
+
+
+def _line(i):
+    return json.dumps({"timestamp": f"2025-01-0{i} 00:00:00", "operation": "Embed", "details": f"entry {i}"}).encode() + b'\n'
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # HistoryManager uses paths relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _rows(manager):
+    return [details for _, _, details in manager.get_history()]
+
+
+def test_torn_last_line_is_truncated(workdir):
+    good = _line(1) + _line(2)
+    (workdir / "history.jsonl").write_bytes(good + b'{"timestamp": "2025-01-03')
+    manager = HistoryManager()
+    assert _rows(manager) == ["entry 1", "entry 2"]
+    assert (workdir / "history.jsonl").read_bytes() == good
+
+    # Appends after the cut start on their own line and load back cleanly
+    manager.add_entry("Extract", "entry 3")
+    manager.flush()
+    assert _rows(HistoryManager()) == ["entry 1", "entry 2", "entry 3"]
+
+
+def test_unterminated_but_complete_last_line_is_kept(workdir):
+    (workdir / "history.jsonl").write_bytes(_line(1) + _line(2).rstrip(b'\n'))
+    assert _rows(HistoryManager()) == ["entry 1", "entry 2"]
+    assert (workdir / "history.jsonl").read_bytes() == _line(1) + _line(2)
+
+
+@pytest.mark.parametrize("bad", [b"garbage", b"[1,2]", b"42", b'{"timestamp": "x", "operation": "Embed"}'])
+def test_malformed_lines_are_skipped(workdir, bad):
+    (workdir / "history.jsonl").write_bytes(_line(1) + bad + b'\n' + _line(2))
+    assert _rows(HistoryManager()) == ["entry 1", "entry 2"]
+
+
+def test_legacy_history_json_is_migrated(workdir):
+    legacy = [json.loads(_line(1)), json.loads(_line(2))]
+    (workdir / "history.json").write_text(json.dumps(legacy))
+    assert _rows(HistoryManager()) == ["entry 1", "entry 2"]
+    lines = (workdir / "history.jsonl").read_bytes().splitlines()
+    assert [json.loads(line) for line in lines] == legacy
+    # Once migrated, the JSON Lines file is the one that is read
+    (workdir / "history.json").write_text("[]")
+    assert _rows(HistoryManager()) == ["entry 1", "entry 2"]
@@ -0,0 +1,58 @@
+import base64
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from gif import GIFSteganographyLogic
+from img import SteganographyLogic
+
+KEY = base64.b64encode(bytes(range(32))).decode()
+# Fernet token written by releases before AES-GCM payloads, under KEY
+LEGACY_TOKEN = (b'gAAAAABq0cRw4cbW3VdBQycz4lUCNSDXOTcy1ojBqMSTALIXJ3_Y9HQb46Nvul0Kb0XSuWfW4ewd6G8yCMpBpap1'
+                b'ltfh2fJksgmJJfmW92nYClqOWEn7xwtSGh7Hpk7HvLxstlxme0qN')
+
+
+@pytest.fixture(params=[SteganographyLogic, GIFSteganographyLogic])
+def logic(request):
+    logic = request.param()
+    assert logic.get_cipher(KEY, None, key_is_generated=True)
+    return logic
+
+
+def test_gcm_round_trip(logic):
+    data = bytes(range(256)) * 40
+    token = logic.encrypt_payload(data)
+    assert token[:1] == logic.PAYLOAD_GCM_VERSION
+    # Stays ASCII so it cannot form the LSB terminator or a GIF trailer byte
+    assert token[1:].isascii() and b';' not in token
+    assert logic.decrypt_payload(token) == data
+
+
+def test_legacy_fernet_token_still_decrypts(logic):
+    assert logic.decrypt_payload(LEGACY_TOKEN) == b'legacy payload from an older release'
+
+
+def test_modified_ciphertext_is_rejected(logic):
+    token = logic.encrypt_payload(b'secret file contents')
+    raw = bytearray(base64.urlsafe_b64decode(token[1:]))
+    raw[20] ^= 0x01
+    with pytest.raises(InvalidTag):
+        logic.decrypt_payload(token[:1] + base64.urlsafe_b64encode(bytes(raw)))
+
+
+def test_wrong_key_is_rejected(logic):
+    token = logic.encrypt_payload(b'secret file contents')
+    other = type(logic)()
+    assert other.get_cipher(base64.b64encode(bytes(32)).decode(), None, key_is_generated=True)
+    with pytest.raises(InvalidTag):
+        other.decrypt_payload(token)
+
+
+@pytest.mark.parametrize('token', [
+    b'\x01abc',  # bad base64 padding
+    b'\x01' + base64.urlsafe_b64encode(b'short'),  # shorter than the nonce
+    b'\x01',
+])
+def test_malformed_gcm_token_is_rejected_like_a_bad_tag(logic, token):
+    with pytest.raises(InvalidTag):
+        logic.decrypt_payload(token)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from img import SteganographyLogic
+
+TERMINATOR = [1] * 15 + [0]
+
+
+def _old_reader(flat):
+    """The byte-by-byte reader read_lsb_payload replaced, minus its error handling."""
+    bits = []
+    i = 0
+    while i < len(flat):
+        bits.append(str(flat[i] & 1))
+        i += 1
+        if i >= 16 and ''.join(bits[-16:]) == '1111111111111110':
+            break
+    if i >= len(flat):
+        return None
+    data_bits = bits[:-16]
+    return bytes(int(''.join(data_bits[j:j + 8]), 2) for j in range(0, len(data_bits), 8))
+
+
+def _carrier(payload, trailing_bits=0, seed=0):
+    """Pixel bytes whose LSBs spell payload + terminator, followed by random LSBs; upper bits are random."""
+    rng = np.random.default_rng(seed)
+    lsbs = np.concatenate([
+        np.unpackbits(np.frombuffer(payload, dtype=np.uint8)),
+        np.array(TERMINATOR, dtype=np.uint8),
+        rng.integers(0, 2, trailing_bits, dtype=np.uint8),
+    ])
+    return (rng.integers(0, 128, lsbs.size, dtype=np.uint8) << 1) | lsbs
+
+
+def _payload(n, seed=0):
+    # Bytes below 0x80 never hold 15 ones in a row, so the payload cannot end early on a false terminator
+    return np.random.default_rng(seed).integers(0, 128, n, dtype=np.uint8).tobytes()
+
+
+@pytest.mark.parametrize('n', [0, 1, 4, 37, 1000])
+@pytest.mark.parametrize('block', [1, 7, 16, 64, 1 << 20])
+def test_matches_old_reader(n, block):
+    flat = _carrier(_payload(n), trailing_bits=333)
+    assert SteganographyLogic().read_lsb_payload(flat, block=block) == _old_reader(flat) == _payload(n)
+
+
+@pytest.mark.parametrize('offset', range(-16, 1))
+def test_terminator_straddling_default_block(offset):
+    # Place the 16 terminator bits at every position across the 1M-sample block edge
+    n_bits = (1 << 20) + offset
+    flat = np.concatenate([np.full(n_bits, 0x80, dtype=np.uint8), _carrier(b'', trailing_bits=50)])
+    flat[:n_bits] |= np.resize(np.array([0, 1], dtype=np.uint8), n_bits)
+    expected = np.packbits(flat[:n_bits - n_bits % 8] & 1).tobytes()
+    assert SteganographyLogic().read_lsb_payload(flat) == expected
+
+
+def test_large_payload_straddles_block_and_matches_old_reader():
+    payload = _payload((1 << 17) - 1)  # terminator spans samples 2**20 - 8 .. 2**20 + 7
+    flat = _carrier(payload, trailing_bits=100)
+    assert SteganographyLogic().read_lsb_payload(flat) == payload
+    assert _old_reader(flat[:(len(payload) + 4) * 8]) == payload
+
+
+@pytest.mark.parametrize('block', [5, 1 << 20])
+def test_no_terminator_returns_none(block):
+    rng = np.random.default_rng(2)
+    flat = rng.integers(0, 256, 5000, dtype=np.uint8) & 0xFE  # every LSB is 0
+    assert SteganographyLogic().read_lsb_payload(flat, block=block) is None
+    flat |= 1  # every LSB is 1
+    assert SteganographyLogic().read_lsb_payload(flat, block=block) is None
+    assert SteganographyLogic().read_lsb_payload(np.zeros(0, dtype=np.uint8)) is None
+
+
+@pytest.mark.parametrize('extra_bits', range(1, 8))
+def test_partial_trailing_byte_is_dropped(extra_bits):
+    # Only whole bytes are returned; the old reader packed the leftover bits into one short final byte
+    payload = _payload(9)
+    lsbs = np.concatenate([np.unpackbits(np.frombuffer(payload, dtype=np.uint8)),
+                           np.zeros(extra_bits, dtype=np.uint8), np.array(TERMINATOR + [1, 0, 1], dtype=np.uint8)])
+    flat = np.full(lsbs.size, 0x40, dtype=np.uint8) | lsbs
+    assert SteganographyLogic().read_lsb_payload(flat, block=8) == payload
+    assert _old_reader(flat)[:-1] == payload
+
+
+def test_terminator_on_last_sample_is_found():
+    # The old reader reported this as missing; the payload is still fully present, so it is returned
+    flat = _carrier(_payload(3))
+    assert SteganographyLogic().read_lsb_payload(flat, block=4) == _payload(3)
+    assert _old_reader(flat) is None
@@ -0,0 +1,52 @@
+import struct
+import zlib
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from img import SteganographyLogic
+
+
+def _chunks(path):
+    """Yield (tag, data, crc_ok) for every chunk after the PNG signature."""
+    with open(path, 'rb') as f:
+        assert f.read(8) == b'\x89PNG\r\n\x1a\n'
+        while header := f.read(8):
+            length, tag = struct.unpack('>I4s', header)
+            data = f.read(length)
+            crc, = struct.unpack('>I', f.read(4))
+            yield tag, data, crc == zlib.crc32(tag + data) & 0xFFFFFFFF
+
+
+@pytest.mark.parametrize('mode', ['RGB', 'RGBA'])
+@pytest.mark.parametrize('size', [(1, 1), (37, 23), (1400, 1200)])  # the largest spans several IDAT blocks
+def test_save_png_decodes_to_identical_pixels(tmp_path, mode, size):
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (size[1], size[0], len(mode)), dtype=np.uint8)
+    path = tmp_path / 'out.png'
+    SteganographyLogic().save_png(Image.fromarray(pixels, mode), path)
+
+    chunks = list(_chunks(path))
+    assert all(crc_ok for _, _, crc_ok in chunks)
+    assert [tag for tag, _, _ in chunks][0] == b'IHDR' and chunks[-1][0] == b'IEND'
+    with Image.open(path) as decoded:
+        assert decoded.mode == mode and decoded.size == size
+        assert np.array_equal(np.asarray(decoded), pixels)
+
+
+def test_embedded_payload_survives_save_png(tmp_path):
+    rng = np.random.default_rng(1)
+    carrier = tmp_path / 'carrier.png'
+    Image.fromarray(rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)).save(carrier)
+    data_file = tmp_path / 'secret.bin'
+    data_file.write_bytes(rng.bytes(2000))
+
+    logic = SteganographyLogic()
+    stego = logic.embed_data(str(carrier), [str(data_file)], 'secretkey', 'passw', 'me', lambda v: None)
+    stego_path = tmp_path / 'stego.png'
+    logic.save_png(stego, stego_path)
+
+    files_data, author, _ = SteganographyLogic().extract_data(str(stego_path), 'secretkey', 'passw', lambda v: None)
+    assert author == 'me'
+    assert [f[2] for f in files_data] == [data_file.read_bytes()]